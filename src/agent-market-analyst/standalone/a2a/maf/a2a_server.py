@@ -14,11 +14,18 @@ the connection stays alive for operations that may take several minutes.
 """
 
 import asyncio
+import json
 import logging
+import logging.handlers
+import queue
 import secrets
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
+from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
+from starlette.routing import Route
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
@@ -39,10 +46,17 @@ from a2a.types import (
     TextPart,
     UnsupportedOperationError,
 )
-from a2a.utils import new_agent_text_message, new_task
+from a2a.utils import AGENT_CARD_WELL_KNOWN_PATH, new_agent_text_message, new_task
 from a2a.utils.errors import ServerError
 
-from agent import MarketAnalystAgent
+from agent import (
+    MarketAnalystAgent,
+    close_scratchpad_pool,
+    close_shared_credential,
+    close_shared_demographics_tool,
+    close_shared_http_client,
+    refresh_shared_credential_token,
+)
 from config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -52,10 +66,39 @@ SESSION_ID_HEADER = "X-Session-ID"
 # Header name for language preference (cs/en)
 LANGUAGE_HEADER = "X-Language"
 
+# Minimum number of buffered response characters per streamed status update
+STREAM_FLUSH_CHARS = 200
+
+# Seconds stop_workers() waits for queued requests to finish before cancelling
+WORKER_DRAIN_TIMEOUT = 30.0
+
+# Authorization scheme prefix, matched against raw header bytes
+BEARER_PREFIX = b"Bearer "
+
+# 401 body is static, so encode it once instead of per rejected request
+UNAUTHORIZED_BODY = json.dumps(
+    {
+        "error": {
+            "code": "unauthorized",
+            "message": (
+                "Invalid or missing API key. Provide via "
+                "'Authorization: Bearer <key>' or 'X-API-Key: <key>' header."
+            ),
+        }
+    }
+).encode("utf-8")
+
+# Pre-encoded 401 response headers. Each rejection sends fresh ASGI message
+# dicts built around these bytes, since servers and middleware may mutate them.
+UNAUTHORIZED_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(UNAUTHORIZED_BODY)).encode("ascii")),
+)
+
 
 class SessionContextBuilder(CallContextBuilder):
     """Custom CallContextBuilder that extracts session context from HTTP headers.
-    
+
     Extracts X-Session-ID and X-Language from incoming A2A requests and stores them in
     ServerCallContext.state for access by the executor. This enables
     session-scoped MCP tool calls where the session ID flows from:
@@ -64,43 +107,50 @@ class SessionContextBuilder(CallContextBuilder):
 
     def build(self, request: Request) -> ServerCallContext:
         """Build ServerCallContext from Starlette Request.
-        
+
         Extracts X-Session-ID and X-Language headers if present and stores in context state.
-        
+
         Args:
             request: The incoming Starlette HTTP request.
-            
+
         Returns:
             ServerCallContext with session_id and language in state if headers were present.
         """
         state = {}
-        
+
         # Extract session ID from header
         session_id = request.headers.get(SESSION_ID_HEADER)
         if session_id:
             state["session_id"] = session_id
-            logger.debug(f"Extracted session_id from header: {session_id}")
+            logger.debug("Extracted session_id from header: %s", session_id)
         else:
-            logger.debug(f"No {SESSION_ID_HEADER} header found in request")
-        
+            logger.debug("No %s header found in request", SESSION_ID_HEADER)
+
         # Extract language preference from header (defaults to 'cs' if not provided)
         language = request.headers.get(LANGUAGE_HEADER, "cs")
         state["language"] = language
-        logger.debug(f"Language preference: {language}")
-        
+        logger.debug("Language preference: %s", language)
+
         return ServerCallContext(state=state)
 
 
 class APIKeyAuthMiddleware:
     """Pure ASGI middleware for API key authentication.
-    
+
     Validates requests using Bearer token or X-API-Key header.
     The agent card endpoint (/.well-known/agent-card.json) is always public.
-    
+
     Uses pure ASGI interface to avoid request body consumption issues
     that can occur with BaseHTTPMiddleware.
+
+    Header values are never decoded: the Bearer prefix check and the key
+    comparison run on raw bytes, so a malformed (non-UTF-8) Authorization
+    or X-API-Key header is rejected with a normal 401 instead of raising
+    UnicodeDecodeError and surfacing as a 500.
     """
 
+    __slots__ = ("app", "_api_key_b")
+
     # Endpoints that don't require authentication
     # Agent Card endpoint MUST be public per A2A spec Section 8.2 - clients
     # need to read the card to discover authentication requirements (securitySchemes)
@@ -112,17 +162,18 @@ class APIKeyAuthMiddleware:
 
     def __init__(self, app: ASGIApp, api_key: str) -> None:
         """Initialize the middleware.
-        
+
         Args:
             app: The ASGI application.
             api_key: The required API key for authentication.
         """
         self.app = app
-        self.api_key = api_key
+        # Header values arrive as bytes, so compare against bytes directly
+        self._api_key_b = api_key.encode("utf-8")
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the ASGI request.
-        
+
         Args:
             scope: The ASGI scope.
             receive: The receive callable.
@@ -134,43 +185,44 @@ class APIKeyAuthMiddleware:
             return
 
         path = scope.get("path", "")
-        
+
         # Allow public endpoints without auth
         if path in self.PUBLIC_PATHS:
             await self.app(scope, receive, send)
             return
 
-        # Extract headers from scope
-        headers = dict(scope.get("headers", []))
-        
-        # Check for API key in headers
-        api_key = None
-        
-        # Check Authorization header (Bearer token)
-        auth_header = headers.get(b"authorization", b"").decode()
-        if auth_header.startswith("Bearer "):
-            api_key = auth_header[7:]  # Remove "Bearer " prefix
-        
-        # Check X-API-Key header as alternative
-        if not api_key:
-            api_key = headers.get(b"x-api-key", b"").decode()
+        # Single pass over the raw header list - no dict build, no decoding
+        auth_bytes = b""
+        xkey_bytes = b""
+        for name, value in scope.get("headers", ()):
+            if name == b"authorization":
+                auth_bytes = value
+            elif name == b"x-api-key":
+                xkey_bytes = value
+
+        # Prefer Authorization: Bearer <key>, fall back to X-API-Key
+        candidate = b""
+        if auth_bytes.startswith(BEARER_PREFIX):
+            candidate = auth_bytes[len(BEARER_PREFIX):]
+        if not candidate:
+            candidate = xkey_bytes
 
         # Validate API key using constant-time comparison
-        if not api_key or not secrets.compare_digest(api_key, self.api_key):
-            client_host = scope.get("client", ("unknown", 0))[0]
-            logger.warning(f"Unauthorized request to {path} from {client_host}")
-            
-            # Return 401 response
-            response = JSONResponse(
-                status_code=401,
-                content={
-                    "error": {
-                        "code": "unauthorized",
-                        "message": "Invalid or missing API key. Provide via 'Authorization: Bearer <key>' or 'X-API-Key: <key>' header.",
-                    }
-                },
+        if not candidate or not secrets.compare_digest(candidate, self._api_key_b):
+            client = scope.get("client")
+            logger.warning(
+                "Unauthorized request to %s from %s",
+                path,
+                client[0] if client else "unknown",
             )
-            await response(scope, receive, send)
+
+            # Return 401 response as raw ASGI messages
+            await send({
+                "type": "http.response.start",
+                "status": 401,
+                "headers": list(UNAUTHORIZED_HEADERS),
+            })
+            await send({"type": "http.response.body", "body": UNAUTHORIZED_BODY})
             return
 
         # Auth passed, continue to app
@@ -183,10 +235,15 @@ class MarketAnalystExecutor(AgentExecutor):
     This class bridges the A2A protocol with the underlying Microsoft Agent
     Framework agent, handling message processing, task management, and
     response generation.
-    
+
     The executor creates per-request agent instances when a session_id is
     provided in the request context (via X-Session-ID header). This enables
     session-scoped MCP tool access for cross-agent collaboration.
+
+    When workers are started (see start_workers), incoming requests are put
+    on a bounded queue and processed by a fixed pool of worker tasks. This
+    caps the number of in-flight Azure OpenAI runs and applies backpressure
+    to bursts of A2A requests.
     """
 
     def __init__(self) -> None:
@@ -194,6 +251,86 @@ class MarketAnalystExecutor(AgentExecutor):
         self._settings = get_settings()
         # Shared agent for requests without session context
         self._shared_agent: MarketAnalystAgent | None = None
+        # Request queue and worker pool (None until start_workers is called)
+        self._request_queue: asyncio.Queue[
+            tuple[RequestContext, EventQueue, asyncio.Future[None]]
+        ] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+
+    def start_workers(self, num_workers: int, max_queue_size: int) -> None:
+        """Start the worker pool that processes queued requests.
+
+        Args:
+            num_workers: Number of requests processed concurrently.
+            max_queue_size: Maximum number of requests waiting for a worker.
+        """
+        self._request_queue = asyncio.Queue(maxsize=max_queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"market-analyst-worker-{i}")
+            for i in range(num_workers)
+        ]
+        logger.info("Started %d executor worker(s) (queue size: %d)", num_workers, max_queue_size)
+
+    async def stop_workers(self) -> None:
+        """Drain the request queue, then cancel the worker pool.
+
+        New requests are processed inline from here on. Queued requests get
+        up to WORKER_DRAIN_TIMEOUT seconds to finish; any still waiting after
+        that are cancelled so their callers do not hang.
+        """
+        request_queue = self._request_queue
+        self._request_queue = None
+        if request_queue is not None:
+            try:
+                async with asyncio.timeout(WORKER_DRAIN_TIMEOUT):
+                    await request_queue.join()
+            except TimeoutError:
+                logger.warning(
+                    "Executor queue not drained in %.0fs; cancelling", WORKER_DRAIN_TIMEOUT
+                )
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if request_queue is not None:
+            while not request_queue.empty():
+                _, _, future = request_queue.get_nowait()
+                future.cancel()
+
+    async def _worker(self) -> None:
+        """Process queued requests until cancelled.
+
+        A caller cancelling its wait (see execute) cancels the future, which
+        in turn cancels the in-flight _process run for that request.
+        """
+        request_queue = self._request_queue
+        assert request_queue is not None
+        while True:
+            context, event_queue, future = await request_queue.get()
+            try:
+                # Caller went away while the request was waiting in the queue
+                if future.done():
+                    continue
+                process = asyncio.ensure_future(self._process(context, event_queue))
+                future.add_done_callback(
+                    lambda f, p=process: p.cancel() if f.cancelled() else None
+                )
+                try:
+                    await asyncio.wait((process,))
+                except asyncio.CancelledError:
+                    process.cancel()
+                    future.cancel()
+                    raise
+                if future.done():
+                    continue
+                if process.cancelled():
+                    future.cancel()
+                elif process.exception() is not None:
+                    future.set_exception(process.exception())
+                else:
+                    future.set_result(None)
+            finally:
+                request_queue.task_done()
 
     async def _get_agent(
         self, 
@@ -201,7 +338,7 @@ class MarketAnalystExecutor(AgentExecutor):
         language: str = "cs",
     ) -> MarketAnalystAgent:
         """Get or create an agent instance.
-        
+
         When session_id or non-default language is provided, creates a new agent
         instance. Otherwise, returns the shared agent instance.
 
@@ -214,7 +351,9 @@ class MarketAnalystExecutor(AgentExecutor):
         """
         # Create per-request agent when session context or custom language is needed
         if session_id or language != "cs":
-            logger.info(f"Creating per-request agent (session: {session_id}, language: {language})")
+            logger.info(
+                "Creating per-request agent (session: %s, language: %s)", session_id, language
+            )
             agent = MarketAnalystAgent(self._settings, session_id=session_id, language=language)
             await agent.initialize()
             return agent
@@ -232,13 +371,37 @@ class MarketAnalystExecutor(AgentExecutor):
     ) -> None:
         """Execute the agent for an incoming A2A message.
 
+        Queues the request for the worker pool and waits for it to finish.
+        Without running workers the request is processed inline. If this
+        call is cancelled, the queued request is skipped or, when already
+        running, cancelled as well.
+
+        Args:
+            context: The request context containing the message and task info.
+            event_queue: Queue for sending events back to the client.
+        """
+        if self._request_queue is None:
+            await self._process(context, event_queue)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        await self._request_queue.put((context, event_queue, future))
+        await future
+
+    async def _process(
+        self,
+        context: RequestContext,
+        event_queue: EventQueue,
+    ) -> None:
+        """Run the agent for a single A2A message.
+
         This method processes incoming messages, runs them through the
         Market Analyst agent, and produces the appropriate A2A response.
-        
+
         If X-Session-ID header was provided in the request, the agent
         will have access to session-scoped MCP Scratchpad for collaboration.
         If X-Language header was provided, the agent will respond in that language.
-        
+
         Keepalive: For long-running operations, sends periodic status updates
         to prevent Azure Load Balancer from dropping the idle connection
         (4-minute timeout).
@@ -254,9 +417,9 @@ class MarketAnalystExecutor(AgentExecutor):
             session_id = context.call_context.state.get("session_id") if context.call_context else None
             language = context.call_context.state.get("language", "cs") if context.call_context else "cs"
             if session_id:
-                logger.info(f"Request has session context: {session_id}")
-            logger.info(f"Request language: {language}")
-            
+                logger.info("Request has session context: %s", session_id)
+            logger.info("Request language: %s", language)
+
             agent = await self._get_agent(session_id, language)
             # Track if we created a session-scoped agent that needs cleanup
             if session_id or language != "cs":
@@ -264,7 +427,7 @@ class MarketAnalystExecutor(AgentExecutor):
 
             # Extract the text content from the message
             user_message = context.get_user_input()
-            
+
             if not user_message:
                 raise ServerError(
                     error=UnsupportedOperationError(
@@ -272,7 +435,8 @@ class MarketAnalystExecutor(AgentExecutor):
                     )
                 )
 
-            logger.info(f"Processing message: {user_message[:100]}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Processing message: %s...", user_message[:100])
 
             # Get or create task
             task = context.current_task
@@ -294,18 +458,40 @@ class MarketAnalystExecutor(AgentExecutor):
                 while True:
                     await asyncio.sleep(60)  # Send every 60 seconds
                     keepalive_count += 1
-                    logger.debug(f"Sending keepalive status update #{keepalive_count}")
+                    logger.debug("Sending keepalive status update #%d", keepalive_count)
                     await updater.update_status(
                         state=TaskState.working,
                         message=new_agent_text_message(
                             f"Analysis in progress... ({keepalive_count} min elapsed)"
                         ),
                     )
-            
+
             keepalive_task = asyncio.create_task(send_keepalive())
 
-            # Run the agent
-            response_text = await agent.run(user_message)
+            # Stream the agent response, forwarding partial text as status
+            # updates so clients see output before the full analysis is done.
+            # The first chunk is forwarded immediately to minimize time to first
+            # byte; later small chunks are coalesced to limit the number of events.
+            chunks: list[str] = []
+            pending: list[str] = []
+            pending_len = 0
+            async for piece in agent.run_stream(user_message):
+                chunks.append(piece)
+                pending.append(piece)
+                pending_len += len(piece)
+                if pending_len >= STREAM_FLUSH_CHARS or len(chunks) == 1:
+                    await updater.update_status(
+                        state=TaskState.working,
+                        message=new_agent_text_message("".join(pending)),
+                    )
+                    pending.clear()
+                    pending_len = 0
+            if pending:
+                await updater.update_status(
+                    state=TaskState.working,
+                    message=new_agent_text_message("".join(pending)),
+                )
+            response_text = "".join(chunks)
 
             # Cancel keepalive before completing
             keepalive_task.cancel()
@@ -324,7 +510,7 @@ class MarketAnalystExecutor(AgentExecutor):
         except ServerError:
             raise
         except Exception as e:
-            logger.exception(f"Error executing agent: {e}")
+            logger.exception("Error executing agent: %s", e)
             raise ServerError(error=UnsupportedOperationError(message=str(e)))
         finally:
             # Cancel keepalive task if still running
@@ -350,7 +536,7 @@ class MarketAnalystExecutor(AgentExecutor):
             context: The request context.
             event_queue: Queue for sending events.
         """
-        logger.info(f"Cancellation requested for task: {context.task_id}")
+        logger.info("Cancellation requested for task: %s", context.task_id)
         raise ServerError(
             error=UnsupportedOperationError(message="cancel not supported")
         )
@@ -377,7 +563,7 @@ def create_agent_card(port: int) -> AgentCard:
     # Build security configuration if API key is enabled
     security_schemes: dict[str, SecurityScheme] | None = None
     security: list[dict[str, list[str]]] | None = None
-    
+
     if settings.a2a_api_key:
         # Declare API key authentication requirement per A2A spec Section 4.5
         security_schemes = {
@@ -454,17 +640,43 @@ def create_agent_card(port: int) -> AgentCard:
     )
 
 
-def create_app(port: int) -> A2AStarletteApplication:
+def create_agent_card_route(agent_card: AgentCard) -> Route:
+    """Create a route that serves the agent card from pre-encoded bytes.
+
+    The card never changes after startup, but the A2A SDK re-serializes it on
+    every discovery request. Registering this route ahead of the SDK routes
+    serves the same JSON without per-request serialization.
+
+    Args:
+        agent_card: The AgentCard to serve.
+
+    Returns:
+        A Starlette route for the well-known agent card path.
+    """
+    body = agent_card.model_dump_json(exclude_none=True, by_alias=True).encode("utf-8")
+
+    async def get_agent_card(request: Request) -> Response:
+        return Response(content=body, media_type="application/json")
+
+    return Route(AGENT_CARD_WELL_KNOWN_PATH, get_agent_card, methods=["GET"])
+
+
+def create_app(
+    port: int,
+    executor: MarketAnalystExecutor | None = None,
+) -> A2AStarletteApplication:
     """Create the A2A Starlette application.
 
     Args:
         port: The server port.
+        executor: Optional executor instance. A new one is created if omitted.
 
     Returns:
         The configured A2A application.
     """
     agent_card = create_agent_card(port)
-    executor = MarketAnalystExecutor()
+    if executor is None:
+        executor = MarketAnalystExecutor()
 
     # Create the request handler with task store
     request_handler = DefaultRequestHandler(
@@ -482,6 +694,45 @@ def create_app(port: int) -> A2AStarletteApplication:
     )
 
 
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Move root log handlers onto a background thread.
+
+    The handlers currently attached to the root logger (typically a stdout
+    StreamHandler) are handed to a QueueListener, and the root logger gets a
+    single QueueHandler instead. Logging from the event loop then becomes a
+    non-blocking queue put; the write syscalls happen on the listener thread.
+
+    Returns:
+        The started listener. Call _stop_log_listener() on shutdown.
+    """
+    root_logger = logging.getLogger()
+    handlers = tuple(root_logger.handlers)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    return listener
+
+
+def _stop_log_listener(listener: logging.handlers.QueueListener) -> None:
+    """Reattach the original handlers to the root logger and flush the log queue.
+
+    The handlers are restored before the listener stops, so records logged
+    in between are written directly instead of being left in the queue.
+    """
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in listener.handlers:
+        root_logger.addHandler(handler)
+    listener.stop()
+
+
 def build_app(port: int = 8020):
     """Build and return the ASGI app.
 
@@ -492,8 +743,55 @@ def build_app(port: int = 8020):
         The Starlette ASGI application.
     """
     settings = get_settings()
-    a2a_app = create_app(port)
-    app = a2a_app.build()
+    log_listener = _start_log_listener()
+    executor = MarketAnalystExecutor()
+    a2a_app = create_app(port, executor)
+
+    @asynccontextmanager
+    async def lifespan(_: Starlette) -> AsyncIterator[None]:
+        """Pre-warm the shared agent on startup and release it on shutdown.
+
+        Moves Azure credential and token acquisition and the MCP handshake
+        off the first user request. A failed warm-up is logged and the agent falls
+        back to lazy initialization on the first request. A background task
+        refreshes the Azure OpenAI token before it expires. The background
+        log listener is stopped last so shutdown messages are flushed.
+        """
+        token_refresher = asyncio.create_task(refresh_shared_credential_token())
+        try:
+            agent = await executor._get_agent()
+            await agent.warmup()
+            logger.info("Shared agent pre-warmed")
+        except Exception:
+            logger.exception("Agent pre-warm failed; will initialize on first request")
+        executor.start_workers(
+            num_workers=settings.a2a_max_concurrent_requests,
+            max_queue_size=settings.a2a_request_queue_size,
+        )
+        yield
+        # Drain and stop the workers first - they still use the agent, the
+        # MCP pools and the credential that are released below
+        await executor.stop_workers()
+        token_refresher.cancel()
+        try:
+            await token_refresher
+        except asyncio.CancelledError:
+            pass
+        if executor._shared_agent is not None:
+            await executor._shared_agent.close()
+            executor._shared_agent = None
+        await close_shared_demographics_tool()
+        await close_scratchpad_pool()
+        await close_shared_http_client()
+        close_shared_credential()
+        _stop_log_listener(log_listener)
+
+    # Routes passed here are matched before the ones the A2A SDK adds
+    app = a2a_app.build(
+        lifespan=lifespan,
+        routes=[create_agent_card_route(a2a_app.agent_card)],
+    )
+    app.state.log_listener = log_listener
 
     # Wrap with API key authentication middleware if configured
     if settings.a2a_api_key:
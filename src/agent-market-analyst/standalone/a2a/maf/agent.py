@@ -5,15 +5,23 @@ from the Microsoft Agent Framework with MCP tool integration for demographics da
 """
 
 import asyncio
+import hashlib
 import logging
+import reprlib
+import time
+from collections import OrderedDict
 from typing import Optional
 
+import httpx
 from agent_framework import ChatAgent, HostedWebSearchTool, MCPStreamableHTTPTool
 from agent_framework.azure import AzureOpenAIResponsesClient
+from azure.core.credentials import AccessToken
 from azure.identity import DefaultAzureCredential
+from openai import AsyncAzureOpenAI
 
 from config import Settings
 from retry_middleware import RateLimitRetryMiddleware
+from tool_middleware import ToolConcurrencyMiddleware
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +30,429 @@ logger = logging.getLogger(__name__)
 MCP_CONNECTION_TIMEOUT = 60.0  # 60 seconds for initial connection/TLS handshake
 MCP_SSE_READ_TIMEOUT = 120.0  # 120 seconds for SSE stream reads (tool execution)
 MCP_REQUEST_TIMEOUT = 90  # 90 seconds for individual MCP requests
+# The agent only uses MCP tools, so connections skip the prompts/list round
+# trip; tools/list runs once per connection and the result is kept on the tool
+MCP_LOAD_PROMPTS = False
+
+# Bounded repr for tool call previews in logs - truncates while formatting,
+# so large MCP payloads are never stringified in full just to be sliced
+_preview_repr = reprlib.Repr()
+_preview_repr.maxstring = 300
+_preview_repr.maxother = 300
+_preview_repr.maxdict = 20
+_preview_repr.maxlist = 20
+
+# Maximum tool calls from a single model turn executing at once
+MAX_CONCURRENT_TOOL_CALLS = 8
+
+# Connection pool for the shared Azure OpenAI HTTP client, sized for A2A
+# fan-in rather than httpx defaults (100 connections / 20 keep-alive)
+AOAI_MAX_CONNECTIONS = 500
+AOAI_MAX_KEEPALIVE_CONNECTIONS = 100
+AOAI_KEEPALIVE_EXPIRY = 60.0
+AOAI_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Azure OpenAI token scope and background refresh timing (seconds)
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+TOKEN_REFRESH_MARGIN = 300  # Refresh 5 minutes before the token expires
+TOKEN_REFRESH_MIN_INTERVAL = 60  # Never poll the credential more often than this
+TOKEN_MIN_VALIDITY = 60  # A cached token closer than this to expiry is fetched anew
+
+# Process-wide Azure credential shared by all agent instances, so the
+# credential chain is probed once and its token cache is reused
+_credential_lock = asyncio.Lock()
+_shared_credential: DefaultAzureCredential | None = None
+# Latest Azure OpenAI token, kept fresh by refresh_shared_credential_token()
+_cached_token: AccessToken | None = None
+_token_lock = asyncio.Lock()
+
+
+async def get_shared_credential() -> DefaultAzureCredential:
+    """Get the process-wide DefaultAzureCredential, creating it on first use."""
+    global _shared_credential
+    if _shared_credential is None:
+        async with _credential_lock:
+            if _shared_credential is None:
+                _shared_credential = DefaultAzureCredential()
+    return _shared_credential
+
+
+async def _fetch_token() -> AccessToken:
+    """Get a new Azure OpenAI token off the event loop and cache it.
+
+    The credential is synchronous and some credentials in its chain (e.g.
+    the Azure CLI) spawn a subprocess, so it always runs in a thread.
+    """
+    global _cached_token
+    credential = await get_shared_credential()
+    _cached_token = await asyncio.to_thread(credential.get_token, COGNITIVE_SERVICES_SCOPE)
+    return _cached_token
+
+
+async def get_cached_token() -> str:
+    """Async Azure AD token provider for AsyncAzureOpenAI.
+
+    Returns the token cached by the background refresher, so requests never
+    call the credential on the event loop. Only when that token is missing
+    or about to expire is a new one fetched, once for all waiting callers.
+    """
+    token = _cached_token
+    if token is None or token.expires_on - time.time() < TOKEN_MIN_VALIDITY:
+        async with _token_lock:
+            token = _cached_token
+            if token is None or token.expires_on - time.time() < TOKEN_MIN_VALIDITY:
+                token = await _fetch_token()
+    return token.token
+
+
+async def refresh_shared_credential_token() -> None:
+    """Keep the cached Azure OpenAI token fresh in the background.
+
+    Fetches a token shortly before the cached one expires so that the
+    refresh never happens inline on a user request. Runs until cancelled.
+    """
+    while True:
+        try:
+            token = await _fetch_token()
+            delay = max(
+                TOKEN_REFRESH_MIN_INTERVAL,
+                token.expires_on - time.time() - TOKEN_REFRESH_MARGIN,
+            )
+            logger.debug("Azure OpenAI token refreshed, next refresh in %.0fs", delay)
+        except Exception as e:
+            logger.warning("Background token refresh failed: %s", e)
+            delay = TOKEN_REFRESH_MIN_INTERVAL
+        await asyncio.sleep(delay)
+
+
+# Azure OpenAI Responses clients shared by all agent instances, keyed by
+# (endpoint, base_url, deployment, api_version), so every agent reuses one
+# HTTP connection pool per target instead of opening its own
+_responses_clients: dict[tuple[str, str, str, str], AzureOpenAIResponsesClient] = {}
+# The AsyncAzureOpenAI client behind each shared Responses client, same keys
+_openai_clients: dict[tuple[str, str, str, str], AsyncAzureOpenAI] = {}
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide httpx client used for Azure OpenAI calls."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=AOAI_MAX_CONNECTIONS,
+                max_keepalive_connections=AOAI_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=AOAI_KEEPALIVE_EXPIRY,
+            ),
+            timeout=AOAI_TIMEOUT,
+        )
+    return _http_client
+
+
+async def get_shared_responses_client(settings: Settings) -> AzureOpenAIResponsesClient:
+    """Get the process-wide Responses client for the configured deployment.
+
+    DefaultAzureCredential works with:
+    - Azure CLI locally (az login)
+    - Managed Identity in Azure containers
+    - Environment variables, VS Code, etc.
+
+    Note: For cognitiveservices.azure.com endpoints, we must explicitly
+    set base_url to include /openai/v1/ path for Responses API.
+
+    The underlying AsyncAzureOpenAI client is built here so it can use the
+    tuned shared HTTP pool. It authenticates through get_cached_token(), an
+    async provider that hands out the token kept fresh by the background
+    refresher, so the synchronous credential never runs on the event loop.
+    """
+    key = (
+        settings.azure_openai_endpoint,
+        settings.azure_openai_base_url,
+        settings.model_deployment_name,
+        settings.azure_openai_api_version,
+    )
+    client = _responses_clients.get(key)
+    if client is None:
+        # No lock is needed - from here to the insert nothing yields to the event loop
+        async_client = AsyncAzureOpenAI(
+            base_url=settings.azure_openai_base_url,
+            api_version=settings.azure_openai_api_version,
+            azure_deployment=settings.model_deployment_name,
+            azure_ad_token_provider=get_cached_token,
+            http_client=_get_http_client(),
+        )
+        client = AzureOpenAIResponsesClient(
+            endpoint=settings.azure_openai_endpoint,
+            base_url=settings.azure_openai_base_url,
+            deployment_name=settings.model_deployment_name,
+            api_version=settings.azure_openai_api_version,
+            async_client=async_client,
+        )
+        _responses_clients[key] = client
+        _openai_clients[key] = async_client
+    return client
+
+
+# In-process LRU of final responses for repeated, session-less queries.
+# Keyed on a hash of (language, message); values are (expires_at, text).
+# Per process and only touched from the event loop, so no lock is needed.
+_response_cache: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+
+
+def _response_cache_key(language: str, message: str) -> bytes:
+    """Build the response cache key for a message in a given language."""
+    return hashlib.sha256(f"{language}\0{message}".encode("utf-8")).digest()
+
+
+def _response_cache_get(key: bytes) -> str | None:
+    """Return a cached response if present and not expired."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, text = entry
+    if expires_at < time.monotonic():
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return text
+
+
+def _response_cache_put(key: bytes, text: str, ttl: float, max_entries: int) -> None:
+    """Store a response, evicting the least recently used entries."""
+    _response_cache[key] = (time.monotonic() + ttl, text)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > max_entries:
+        _response_cache.popitem(last=False)
+
+
+class _MCPConnection:
+    """An MCP tool whose connection is owned by one background task.
+
+    anyio requires a cancel scope to be exited by the task that entered it,
+    so the owner task both enters the tool and, once close() is called,
+    exits it. Callers await `connected` before using the tool.
+    """
+
+    __slots__ = ("tool", "connected", "_closing", "_owner")
+
+    def __init__(self, tool: MCPStreamableHTTPTool) -> None:
+        self.tool = tool
+        self.connected: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._owner = asyncio.create_task(self._own(), name=f"mcp-{tool.name}")
+
+    async def _own(self) -> None:
+        """Connect the tool, hold it open until close() and then disconnect it."""
+        try:
+            await self.tool.__aenter__()
+        except asyncio.CancelledError:
+            self.connected.cancel()
+            raise
+        except Exception as e:
+            self.connected.set_exception(e)
+            return
+        self.connected.set_result(None)
+        try:
+            await self._closing.wait()
+        finally:
+            await self.tool.__aexit__(None, None, None)
+
+    def failed(self) -> bool:
+        """Check whether the connection attempt ended in an error."""
+        connected = self.connected
+        return connected.done() and (connected.cancelled() or connected.exception() is not None)
+
+    async def close(self) -> None:
+        """Disconnect the tool, abandoning a handshake that is still running.
+
+        Errors raised while disconnecting are propagated.
+        """
+        if not self.connected.done():
+            self._owner.cancel()
+        self._closing.set()
+        await asyncio.wait((self._owner,))
+        if not self._owner.cancelled():
+            self._owner.result()
+
+
+# Demographics MCP session shared by all agent instances. Its headers carry
+# no session context, so one connection serves every request and the
+# initialize handshake is paid once per process instead of once per agent.
+_shared_demographics: _MCPConnection | None = None
+
+
+async def get_shared_demographics_tool(settings: Settings) -> MCPStreamableHTTPTool:
+    """Get the process-wide Demographics MCP tool, connecting it on first use."""
+    global _shared_demographics
+    connection = _shared_demographics
+    if connection is None:
+        # Registered before the first await so concurrent callers share one handshake
+        connection = _shared_demographics = _MCPConnection(
+            MCPStreamableHTTPTool(
+                name="demographics",
+                url=settings.mcp_demographics_url,
+                description="Demographic and consumer behavior data for market analysis",
+                headers={"Authorization": f"Bearer {settings.mcp_demographics_api_key}"},
+                timeout=MCP_CONNECTION_TIMEOUT,
+                sse_read_timeout=MCP_SSE_READ_TIMEOUT,
+                request_timeout=MCP_REQUEST_TIMEOUT,
+                load_prompts=MCP_LOAD_PROMPTS,
+            )
+        )
+    try:
+        await asyncio.shield(connection.connected)
+    except BaseException:
+        # Forget a broken connection so the next caller reconnects
+        if connection.failed() and _shared_demographics is connection:
+            _shared_demographics = None
+        raise
+    return connection.tool
+
+
+async def close_shared_demographics_tool() -> None:
+    """Disconnect the shared Demographics MCP tool if it was connected."""
+    global _shared_demographics
+    if _shared_demographics is not None:
+        connection = _shared_demographics
+        _shared_demographics = None
+        await connection.close()
+
+
+# Scratchpad MCP sessions pooled per orchestrator session. Agents serving the
+# same session share one connection; it is reference counted and lingers
+# briefly after the last agent releases it, so back-to-back requests in a
+# session skip the initialize handshake.
+MCP_SCRATCHPAD_LINGER = 30.0  # Seconds an unused scratchpad session stays open
+
+
+class _PooledScratchpad:
+    """A pooled scratchpad connection with its reference count."""
+
+    __slots__ = ("connection", "refcount", "release_handle")
+
+    def __init__(self, connection: _MCPConnection) -> None:
+        self.connection = connection
+        self.refcount = 0
+        self.release_handle: asyncio.TimerHandle | None = None
+
+
+_scratchpad_pool: dict[str, _PooledScratchpad] = {}
+_scratchpad_close_tasks: set[asyncio.Task] = set()
+
+
+async def acquire_scratchpad_tool(settings: Settings, session_id: str) -> MCPStreamableHTTPTool:
+    """Get the connected Scratchpad MCP tool for a session, taking a reference.
+
+    Every successful call must be paired with release_scratchpad_tool().
+    """
+    entry = _scratchpad_pool.get(session_id)
+    if entry is None:
+        tool = MCPStreamableHTTPTool(
+            name="scratchpad",
+            url=settings.mcp_scratchpad_url,
+            description=(
+                "Shared scratchpad for session-scoped collaboration with other agents. "
+                "Use to read findings from other agents and write your own analysis."
+            ),
+            headers={
+                "Authorization": f"Bearer {settings.mcp_scratchpad_api_key}",
+                "X-Session-ID": session_id,
+                "X-Caller-Agent": "market-analyst",
+            },
+            timeout=MCP_CONNECTION_TIMEOUT,
+            sse_read_timeout=MCP_SSE_READ_TIMEOUT,
+            request_timeout=MCP_REQUEST_TIMEOUT,
+            load_prompts=MCP_LOAD_PROMPTS,
+        )
+        # Registered before the first await so concurrent callers share one handshake
+        entry = _PooledScratchpad(_MCPConnection(tool))
+        _scratchpad_pool[session_id] = entry
+
+    if entry.release_handle is not None:
+        entry.release_handle.cancel()
+        entry.release_handle = None
+    entry.refcount += 1
+    try:
+        await asyncio.shield(entry.connection.connected)
+    except BaseException:
+        if entry.connection.failed():
+            # Forget the broken session so the next caller reconnects
+            entry.refcount -= 1
+            if _scratchpad_pool.get(session_id) is entry:
+                del _scratchpad_pool[session_id]
+        else:
+            # This caller was cancelled; the handshake continues for others
+            release_scratchpad_tool(session_id)
+        raise
+    return entry.connection.tool
+
+
+def release_scratchpad_tool(session_id: str) -> None:
+    """Drop a reference taken by acquire_scratchpad_tool().
+
+    The connection is closed MCP_SCRATCHPAD_LINGER seconds after the last
+    reference is released, unless the session is acquired again first.
+    """
+    entry = _scratchpad_pool.get(session_id)
+    if entry is None:
+        return
+    entry.refcount -= 1
+    if entry.refcount == 0:
+        entry.release_handle = asyncio.get_running_loop().call_later(
+            MCP_SCRATCHPAD_LINGER, _expire_scratchpad, session_id, entry
+        )
+
+
+def _expire_scratchpad(session_id: str, entry: _PooledScratchpad) -> None:
+    """Close a pooled scratchpad session that stayed unused past its linger time."""
+    if _scratchpad_pool.get(session_id) is not entry or entry.refcount:
+        return
+    del _scratchpad_pool[session_id]
+    task = asyncio.create_task(entry.connection.close())
+    _scratchpad_close_tasks.add(task)
+    task.add_done_callback(_scratchpad_close_tasks.discard)
+
+
+async def close_scratchpad_pool() -> None:
+    """Disconnect every pooled scratchpad session."""
+    entries = list(_scratchpad_pool.values())
+    _scratchpad_pool.clear()
+    for entry in entries:
+        if entry.release_handle is not None:
+            entry.release_handle.cancel()
+    results = await asyncio.gather(
+        *(entry.connection.close() for entry in entries),
+        *_scratchpad_close_tasks,
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Failed to close scratchpad MCP session: %s", result)
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared Azure OpenAI HTTP client if it was created."""
+    global _http_client
+    _responses_clients.clear()
+    _openai_clients.clear()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def close_shared_credential() -> None:
+    """Close the shared credential if it was created.
+
+    Shared Responses clients authenticate with the credential's cached
+    token, so they are dropped along with that token.
+    """
+    global _shared_credential, _cached_token
+    _responses_clients.clear()
+    _openai_clients.clear()
+    _cached_token = None
+    if _shared_credential is not None:
+        _shared_credential.close()
+        _shared_credential = None
 
 
 class MarketAnalystAgent:
@@ -53,6 +484,28 @@ class MarketAnalystAgent:
         self._agent: ChatAgent | None = None
         self._mcp_demographics: MCPStreamableHTTPTool | None = None
         self._mcp_scratchpad: MCPStreamableHTTPTool | None = None
+        # Serializes initialize() so concurrent first requests build only once
+        self._init_lock = asyncio.Lock()
+
+    def _cache_key(self, message: str) -> bytes | None:
+        """Get the response cache key, or None when caching does not apply.
+
+        Session-scoped agents are never cached: their runs write to the
+        shared scratchpad, and skipping the run would skip those writes.
+        """
+        if not self._settings.enable_response_cache or self._session_id:
+            return None
+        return _response_cache_key(self._language, message)
+
+    def _cache_store(self, key: bytes | None, text: str) -> None:
+        """Store a response under key if caching applies."""
+        if key is not None and text:
+            _response_cache_put(
+                key,
+                text,
+                ttl=self._settings.response_cache_ttl_seconds,
+                max_entries=self._settings.response_cache_max_entries,
+            )
 
     @property
     def system_prompt(self) -> str:
@@ -60,107 +513,46 @@ class MarketAnalystAgent:
         return self._settings.get_system_prompt(language=self._language)
 
     async def initialize(self) -> None:
-        """Initialize the agent with Azure OpenAI connection and MCP tools."""
+        """Initialize the agent with Azure OpenAI connection and MCP tools.
+
+        Safe to call concurrently: the first caller builds the agent and
+        the others wait for it instead of building their own.
+        """
         if self._agent is not None:
             return
-
-        logger.info("=" * 60)
-        logger.info("[INIT] Initializing Market Analyst Agent")
-        logger.info(f"[INIT] Azure OpenAI Endpoint: {self._settings.azure_openai_endpoint}")
-        logger.info(f"[INIT] Model: {self._settings.model_deployment_name}")
-        if self._session_id:
-            logger.info(f"[INIT] Session ID: {self._session_id}")
-        
-        # List to collect MCP tools
-        mcp_tools = []
-        
-        # Create MCP Demographics tool with authentication
-        logger.info(f"[MCP INIT] Connecting to MCP Demographics server...")
-        logger.info(f"[MCP INIT] URL: {self._settings.mcp_demographics_url}")
-        self._mcp_demographics = MCPStreamableHTTPTool(
-            name="demographics",
-            url=self._settings.mcp_demographics_url,
-            description="Demographic and consumer behavior data for market analysis",
-            headers={"Authorization": f"Bearer {self._settings.mcp_demographics_api_key}"},
-            timeout=MCP_CONNECTION_TIMEOUT,
-            sse_read_timeout=MCP_SSE_READ_TIMEOUT,
-            request_timeout=MCP_REQUEST_TIMEOUT,
+        async with self._init_lock:
+            if self._agent is None:
+                await self._build_agent()
+
+    async def _build_agent(self) -> None:
+        """Connect MCP tools and create the underlying ChatAgent."""
+        logger.info(
+            "[INIT] Initializing Market Analyst Agent\n"
+            "  endpoint=%s\n  model=%s\n  session=%s\n"
+            "  demographics_url=%s\n  scratchpad_url=%s",
+            self._settings.azure_openai_endpoint,
+            self._settings.model_deployment_name,
+            self._session_id or "-",
+            self._settings.mcp_demographics_url,
+            self._settings.mcp_scratchpad_url if self._session_id else "- (no session)",
         )
 
-        # Connect to the MCP server
-        await self._mcp_demographics.__aenter__()
-        
-        # Log available MCP tools
-        if self._mcp_demographics.functions:
-            tool_names = [f.name for f in self._mcp_demographics.functions]
-            logger.info(f"[MCP INIT] Demographics connection successful! {len(tool_names)} tools available:")
-            for name in tool_names:
-                logger.info(f"[MCP INIT]   - {name}")
-        else:
-            logger.warning("[MCP INIT] Demographics connected but no tools were loaded!")
-        mcp_tools.append(self._mcp_demographics)
-        
-        # Create MCP Scratchpad tool with session scope (if session_id provided)
-        if self._session_id:
-            logger.info(f"[MCP INIT] Connecting to MCP Scratchpad server...")
-            logger.info(f"[MCP INIT] URL: {self._settings.mcp_scratchpad_url}")
-            logger.info(f"[MCP INIT] Session ID: {self._session_id}")
-            
-            # Headers for session-scoped access
-            scratchpad_headers = {
-                "Authorization": f"Bearer {self._settings.mcp_scratchpad_api_key}",
-                "X-Session-ID": self._session_id,
-                "X-Caller-Agent": "market-analyst",
-            }
-            
-            self._mcp_scratchpad = MCPStreamableHTTPTool(
-                name="scratchpad",
-                url=self._settings.mcp_scratchpad_url,
-                description="Shared scratchpad for session-scoped collaboration with other agents. Use to read findings from other agents and write your own analysis.",
-                headers=scratchpad_headers,
-                timeout=MCP_CONNECTION_TIMEOUT,
-                sse_read_timeout=MCP_SSE_READ_TIMEOUT,
-                request_timeout=MCP_REQUEST_TIMEOUT,
-            )
-            
-            # Connect to the MCP Scratchpad server
-            await self._mcp_scratchpad.__aenter__()
-            
-            # Log available tools
-            if self._mcp_scratchpad.functions:
-                tool_names = [f.name for f in self._mcp_scratchpad.functions]
-                logger.info(f"[MCP INIT] Scratchpad connection successful! {len(tool_names)} tools available:")
-                for name in tool_names:
-                    logger.info(f"[MCP INIT]   - {name}")
-            else:
-                logger.warning("[MCP INIT] Scratchpad connected but no tools were loaded!")
+        # Connect to all MCP servers concurrently - the handshakes are independent
+        await self._connect_mcp_tools()
+        mcp_tools = [self._mcp_demographics]
+        if self._mcp_scratchpad is not None:
             mcp_tools.append(self._mcp_scratchpad)
-        else:
-            logger.info("[MCP INIT] No session ID - scratchpad tool not enabled")
+        for tool in mcp_tools:
+            self._log_mcp_tools(tool)
 
         # Add web search tool for real-time market information
-        logger.info("[TOOL INIT] Adding web search capability...")
         web_search_tool = HostedWebSearchTool(
             description="Search the web for current market trends, news, and real-time information",
         )
         mcp_tools.append(web_search_tool)
-        logger.info("[TOOL INIT] Web search tool added")
-
-        # DefaultAzureCredential works with:
-        # - Azure CLI locally (az login)
-        # - Managed Identity in Azure containers
-        # - Environment variables, VS Code, etc.
-        #
-        # Note: For cognitiveservices.azure.com endpoints, we must explicitly
-        # set base_url to include /openai/v1/ path for Responses API
-        logger.info("[INIT] Creating Azure OpenAI Responses client...")
-        responses_client = AzureOpenAIResponsesClient(
-            credential=DefaultAzureCredential(),
-            endpoint=self._settings.azure_openai_endpoint,
-            base_url=self._settings.azure_openai_base_url,
-            deployment_name=self._settings.model_deployment_name,
-            api_version=self._settings.azure_openai_api_version,
-        )
+
+        # Shared across agents - close() must not tear it down
+        responses_client = await get_shared_responses_client(self._settings)
 
         # Create retry middleware for handling 429 rate limit errors
         retry_middleware = RateLimitRetryMiddleware(
@@ -169,13 +561,79 @@ class MarketAnalystAgent:
             max_delay=60.0,
         )
 
+        # Independent lookups in one turn run concurrently, within a cap
+        tool_middleware = ToolConcurrencyMiddleware(max_concurrent=MAX_CONCURRENT_TOOL_CALLS)
+
         self._agent = responses_client.create_agent(
             instructions=self.system_prompt,
             tools=mcp_tools,
-            middleware=[retry_middleware],
+            middleware=[retry_middleware, tool_middleware],
+            allow_multiple_tool_calls=True,
+        )
+        logger.info(
+            "[INIT] Agent initialized successfully with %d tool(s) (incl. web search)",
+            len(mcp_tools),
         )
-        logger.info(f"[INIT] Agent initialized successfully with {len(mcp_tools)} MCP tool(s)!")
-        logger.info("=" * 60)
+
+    async def warmup(self) -> None:
+        """Prepare the agent so the first real request skips cold-start work.
+
+        Connects the MCP tools, builds the shared Responses client,
+        caches an Azure OpenAI token (see get_cached_token)
+        and sends one cheap authenticated request (models.list) through the
+        shared HTTP pool, so the TLS connection is already open. A failed
+        request is only logged - the agent still serves traffic without it.
+        """
+        await self.initialize()
+        await get_cached_token()
+        openai_client = _openai_clients.get(
+            (
+                self._settings.azure_openai_endpoint,
+                self._settings.azure_openai_base_url,
+                self._settings.model_deployment_name,
+                self._settings.azure_openai_api_version,
+            )
+        )
+        if openai_client is None:
+            return
+        try:
+            await openai_client.models.list()
+        except Exception as e:
+            logger.warning("Azure OpenAI warmup request failed: %s", e)
+
+    async def _connect_mcp_tools(self) -> None:
+        """Obtain the shared Demographics tool and, with a session, the pooled Scratchpad tool.
+
+        Both come from process-wide pools and are connected concurrently.
+        If either fails, a scratchpad reference that was taken is released
+        again and the first error is re-raised.
+        """
+        tasks = [get_shared_demographics_tool(self._settings)]
+        if self._session_id:
+            tasks.append(acquire_scratchpad_tool(self._settings, self._session_id))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if not errors:
+            self._mcp_demographics = results[0]
+            self._mcp_scratchpad = results[1] if self._session_id else None
+            return
+
+        if self._session_id and not isinstance(results[1], BaseException):
+            release_scratchpad_tool(self._session_id)
+        raise errors[0]
+
+    @staticmethod
+    def _log_mcp_tools(tool: MCPStreamableHTTPTool) -> None:
+        """Log the functions exposed by a connected MCP tool."""
+        if tool.functions:
+            logger.info(
+                "[MCP INIT] %s connected with %d tool(s): %s",
+                tool.name,
+                len(tool.functions),
+                ", ".join(f.name for f in tool.functions),
+            )
+        else:
+            logger.warning("[MCP INIT] %s connected but no tools were loaded!", tool.name)
 
     async def run(self, message: str) -> str:
         """Run the agent with a user message and return the response.
@@ -186,38 +644,49 @@ class MarketAnalystAgent:
         Returns:
             The agent's response text.
         """
+        cache_key = self._cache_key(message)
+        if cache_key is not None:
+            cached = _response_cache_get(cache_key)
+            if cached is not None:
+                logger.info("[CACHE] Returning cached response (%d chars)", len(cached))
+                return cached
+
         if self._agent is None:
             await self.initialize()
 
         # Log input (first 150 chars)
-        input_preview = message[:150] + "..." if len(message) > 150 else message
-        logger.info(f"[INPUT] User message: {input_preview}")
-        
+        if logger.isEnabledFor(logging.INFO):
+            input_preview = message[:150] + "..." if len(message) > 150 else message
+            logger.info("[INPUT] User message: %s", input_preview)
+
         result = await self._agent.run(message)
-        
-        # Log MCP tool calls if any were made
-        if hasattr(result, 'tool_calls') and result.tool_calls:
-            logger.info(f"[MCP] {len(result.tool_calls)} tool call(s) made")
-            for i, tool_call in enumerate(result.tool_calls, 1):
-                logger.info(f"[MCP CALL {i}] Tool: {tool_call.name}")
-                # Log tool input (first 200 chars)
-                args_str = str(tool_call.arguments) if tool_call.arguments else "{}"
-                args_preview = args_str[:200] + "..." if len(args_str) > 200 else args_str
-                logger.info(f"[MCP CALL {i}] Input: {args_preview}")
-                # Log tool output (first 300 chars)
-                if tool_call.result:
-                    result_str = str(tool_call.result)
-                    result_preview = result_str[:300] + "..." if len(result_str) > 300 else result_str
-                    logger.info(f"[MCP CALL {i}] Output: {result_preview}")
-                else:
-                    logger.info(f"[MCP CALL {i}] Output: None")
-        else:
-            logger.info("[MCP] No tool calls made for this request")
-        
-        # Log output (first 200 chars)
-        output_preview = result.text[:200] + "..." if len(result.text) > 200 else result.text
-        logger.info(f"[OUTPUT] Agent response ({len(result.text)} chars): {output_preview}")
-        
+
+        # Log MCP tool calls and output - previews are only built when INFO is enabled
+        if logger.isEnabledFor(logging.INFO):
+            if hasattr(result, 'tool_calls') and result.tool_calls:
+                logger.info("[MCP] %d tool call(s) made", len(result.tool_calls))
+                for i, tool_call in enumerate(result.tool_calls, 1):
+                    logger.info("[MCP CALL %d] Tool: %s", i, tool_call.name)
+                    # Log tool input and output as bounded reprs
+                    logger.info(
+                        "[MCP CALL %d] Input: %s",
+                        i,
+                        _preview_repr.repr(tool_call.arguments) if tool_call.arguments else "{}",
+                    )
+                    if tool_call.result:
+                        logger.info(
+                            "[MCP CALL %d] Output: %s", i, _preview_repr.repr(tool_call.result)
+                        )
+                    else:
+                        logger.info("[MCP CALL %d] Output: None", i)
+            else:
+                logger.info("[MCP] No tool calls made for this request")
+
+            # Log output (first 200 chars)
+            output_preview = result.text[:200] + "..." if len(result.text) > 200 else result.text
+            logger.info("[OUTPUT] Agent response (%d chars): %s", len(result.text), output_preview)
+
+        self._cache_store(cache_key, result.text)
         return result.text
 
     async def run_stream(self, message: str):
@@ -229,27 +698,39 @@ class MarketAnalystAgent:
         Yields:
             Chunks of the agent's response.
         """
+        cache_key = self._cache_key(message)
+        if cache_key is not None:
+            cached = _response_cache_get(cache_key)
+            if cached is not None:
+                logger.info("[CACHE] Returning cached response (%d chars)", len(cached))
+                yield cached
+                return
+
         if self._agent is None:
             await self.initialize()
 
+        chunks: list[str] = []
         async for chunk in self._agent.run_stream(message):
             if chunk.text:
+                chunks.append(chunk.text)
                 yield chunk.text
+        self._cache_store(cache_key, "".join(chunks))
 
     async def close(self) -> None:
         """Clean up resources."""
+        closed = []
         if self._mcp_scratchpad is not None:
-            logger.info("[SHUTDOWN] Disconnecting from MCP Scratchpad server...")
-            await self._mcp_scratchpad.__aexit__(None, None, None)
+            release_scratchpad_tool(self._session_id)
             self._mcp_scratchpad = None
-            logger.info("[SHUTDOWN] MCP Scratchpad connection closed")
-        if self._mcp_demographics is not None:
-            logger.info("[SHUTDOWN] Disconnecting from MCP Demographics server...")
-            await self._mcp_demographics.__aexit__(None, None, None)
-            self._mcp_demographics = None
-            logger.info("[SHUTDOWN] MCP Demographics connection closed")
+            closed.append("scratchpad")
+        # The Demographics tool and the Responses client are shared
+        # process-wide, so only drop our references to them
+        self._mcp_demographics = None
         self._agent = None
-        logger.info("[SHUTDOWN] Agent resources released")
+        logger.info(
+            "[SHUTDOWN] Agent resources released (MCP released: %s)",
+            ", ".join(closed) or "none",
+        )
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -268,6 +749,10 @@ async def main():
             "What is the estimated market size for specialty coffee in Brno, Czech Republic?"
         )
         print(f"Agent: {response}")
+    await close_shared_demographics_tool()
+    await close_scratchpad_pool()
+    await close_shared_http_client()
+    close_shared_credential()
 
 
 if __name__ == "__main__":
@@ -51,6 +51,13 @@ class Settings(BaseSettings):
         "and industry dynamics insights for specialty coffee markets in Brno and Vienna."
     )
     a2a_agent_version: str = "1.0.0"
+    a2a_max_concurrent_requests: int = 8  # Worker tasks running the agent concurrently
+    a2a_request_queue_size: int = 64  # Requests waiting for a worker before callers block
+
+    # Response cache for repeated session-less queries (in-process, per worker)
+    enable_response_cache: bool = False
+    response_cache_ttl_seconds: float = 600.0  # Market data changes slowly
+    response_cache_max_entries: int = 512
 
     @property
     def a2a_public_url(self) -> str:
@@ -98,10 +105,23 @@ class Settings(BaseSettings):
             The rendered system prompt content.
         """
         prompt_path = self.prompts_dir / "system_prompt.jinja2"
-        if prompt_path.exists():
-            template = Template(prompt_path.read_text(encoding="utf-8"))
-            return template.render(language=language)
-        raise FileNotFoundError(f"System prompt not found: {prompt_path}")
+        try:
+            mtime_ns = prompt_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"System prompt not found: {prompt_path}") from None
+        return _render_system_prompt(prompt_path, language, mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _render_system_prompt(prompt_path: Path, language: str, mtime_ns: int) -> str:
+    """Read and render a system prompt template once per path, language and version.
+
+    Agent rebuilds reuse the rendered text instead of re-reading the file.
+    The file's modification time is part of the cache key, so an edited
+    prompt is picked up on the next agent build at the cost of one stat().
+    """
+    template = Template(prompt_path.read_text(encoding="utf-8"))
+    return template.render(language=language)
 
 
 @lru_cache
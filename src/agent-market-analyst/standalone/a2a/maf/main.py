@@ -49,11 +49,14 @@ def main() -> None:
     # Build the app with the configured port
     app = build_app(port)
 
+    # uvicorn[standard] ships uvloop and httptools, which the default "auto"
+    # loop/http settings pick up; per-request access logging is disabled
     uvicorn.run(
         app,
         host=host,
         port=port,
         log_level="info",
+        access_log=False,
     )
 
 
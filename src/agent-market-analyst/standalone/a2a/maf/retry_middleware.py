@@ -14,40 +14,88 @@ import re
 from collections.abc import Awaitable, Callable
 
 from agent_framework import ChatContext, ChatMiddleware
-from agent_framework.exceptions import ServiceResponseException
+from openai import APIStatusError
 
 logger = logging.getLogger(__name__)
 
 
-def _is_rate_limit_error(exception: Exception) -> bool:
-    """Check if an exception is a rate limit (429) error."""
-    error_str = str(exception).lower()
-    rate_limit_indicators = [
-        "429", "rate limit", "rate_limit", "ratelimit",
-        "too many requests", "too_many_requests", "throttl",
-        "quota exceeded", "request rate too large",
-    ]
-    return any(indicator in error_str for indicator in rate_limit_indicators)
+# Compiled once at import: a single alternation scan replaces one substring
+# search per indicator and one implicit pattern lookup per retry-after form
+_RATE_LIMIT_PATTERN = re.compile(
+    r"429|rate[ _]?limit|too[ _]many[ _]requests|throttl"
+    r"|quota exceeded|request rate too large",
+    re.IGNORECASE,
+)
+_RETRY_AFTER_PATTERN = re.compile(
+    r"retry[- ]?after[:\s]*(\d+(?:\.\d+)?)"
+    r"|(?:try again in|wait) (\d+(?:\.\d+)?)\s*second",
+    re.IGNORECASE,
+)
 
 
-def _extract_retry_after(exception: Exception) -> float | None:
-    """Extract retry-after value from exception if available."""
-    error_str = str(exception)
-    patterns = [
-        r"retry[- ]?after[:\s]*(\d+(?:\.\d+)?)",
-        r"try again in (\d+(?:\.\d+)?)\s*second",
-        r"wait (\d+(?:\.\d+)?)\s*second",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, error_str, re.IGNORECASE)
-        if match:
+def _is_rate_limit_error(error_str: str) -> bool:
+    """Check if an exception message describes a rate limit (429) error."""
+    return _RATE_LIMIT_PATTERN.search(error_str) is not None
+
+
+def _extract_retry_after(error_str: str) -> float | None:
+    """Extract retry-after value from an exception message if available."""
+    match = _RETRY_AFTER_PATTERN.search(error_str)
+    return float(match.group(match.lastindex)) if match else None
+
+
+def _find_status_error(exception: BaseException) -> APIStatusError | None:
+    """Find the SDK HTTP error in an exception's cause chain.
+
+    Agent Framework wraps OpenAI SDK errors in its own service exceptions,
+    so the structured error is usually the __cause__.
+    """
+    current: BaseException | None = exception
+    while current is not None:
+        if isinstance(current, APIStatusError):
+            return current
+        current = current.__cause__
+    return None
+
+
+def _retry_after_from_headers(error: APIStatusError) -> float | None:
+    """Read the retry delay from the response headers if the server sent one."""
+    headers = error.response.headers
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value:
             try:
-                return float(match.group(1))
+                return float(value) * scale
             except ValueError:
                 pass
     return None
 
 
+def _classify_rate_limit(exception: Exception) -> tuple[bool, float | None]:
+    """Decide whether an exception is a rate limit error and how long to wait.
+
+    The HTTP status code and Retry-After headers are used when the SDK
+    error is available; message sniffing is the fallback for errors that
+    only carry text.
+
+    Returns:
+        Tuple of (is_rate_limit, retry_after_seconds).
+    """
+    status_error = _find_status_error(exception)
+    if status_error is not None:
+        if status_error.status_code != 429:
+            return False, None
+        retry_after = _retry_after_from_headers(status_error)
+        if retry_after is None:
+            retry_after = _extract_retry_after(str(exception))
+        return True, retry_after
+
+    error_str = str(exception)
+    if not _is_rate_limit_error(error_str):
+        return False, None
+    return True, _extract_retry_after(error_str)
+
+
 class RateLimitRetryMiddleware(ChatMiddleware):
     """Chat middleware that retries on rate limit (429) errors with exponential backoff."""
 
@@ -64,15 +112,20 @@ class RateLimitRetryMiddleware(ChatMiddleware):
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        # Backoff schedule without jitter, indexed by attempt number
+        self._base_delays = [
+            min(initial_delay * (exponential_base ** i), max_delay)
+            for i in range(max_retries + 1)
+        ]
 
     def _calculate_delay(self, attempt: int, retry_after: float | None = None) -> float:
         if retry_after is not None and retry_after > 0:
             delay = min(retry_after, self.max_delay)
         else:
-            delay = self.initial_delay * (self.exponential_base ** attempt)
-            delay = min(delay, self.max_delay)
+            delay = self._base_delays[attempt]
         if self.jitter:
-            delay += delay * random.uniform(0, 0.25)
+            # Up to +25% jitter from 8 random bits (0/1024 .. 255/1024)
+            delay += delay * (random.getrandbits(8) / 1024.0)
         return delay
 
     async def process(
@@ -80,41 +133,22 @@ class RateLimitRetryMiddleware(ChatMiddleware):
         context: ChatContext,
         next: Callable[[ChatContext], Awaitable[None]],
     ) -> None:
-        last_exception: Exception | None = None
-
         for attempt in range(self.max_retries + 1):
             try:
                 await next(context)
                 if attempt > 0:
                     logger.info("Chat request succeeded after %d retry attempt(s)", attempt)
                 return
-            except ServiceResponseException as exc:
-                last_exception = exc
-                if not _is_rate_limit_error(exc):
+            except Exception as exc:
+                is_rate_limit, retry_after = _classify_rate_limit(exc)
+                if not is_rate_limit:
                     raise
                 if attempt >= self.max_retries:
                     logger.error("Max retries (%d) exceeded for rate limit error", self.max_retries)
                     raise
-                retry_after = _extract_retry_after(exc)
                 delay = self._calculate_delay(attempt, retry_after)
                 logger.warning(
                     "Rate limit (429) encountered. Retry %d/%d in %.1f seconds.",
                     attempt + 1, self.max_retries, delay,
                 )
                 await asyncio.sleep(delay)
-            except Exception as exc:
-                if _is_rate_limit_error(exc):
-                    last_exception = exc
-                    if attempt >= self.max_retries:
-                        raise
-                    delay = self._calculate_delay(attempt, _extract_retry_after(exc))
-                    logger.warning(
-                        "Rate limit detected. Retry %d/%d in %.1f seconds.",
-                        attempt + 1, self.max_retries, delay,
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    raise
-
-        if last_exception is not None:
-            raise last_exception
@@ -1,15 +1,31 @@
-"""Quick test to verify Azure OpenAI connection works."""
+"""Quick test to verify Azure OpenAI connection works.
+
+Sends one probe to check the connection, then a batch of concurrent probes
+over the same shared client to measure latency with a warm connection pool.
+A first probe that is much slower than the batch p50 points at cold-start
+cost (TLS handshake, token acquisition).
+"""
 
 import asyncio
-from azure.identity import DefaultAzureCredential
-from agent_framework.azure import AzureOpenAIResponsesClient
+import time
 
+from agent import close_shared_credential, close_shared_http_client, get_shared_responses_client
 from config import get_settings
 
+# Number of concurrent probes sent after the first one
+PROBE_COUNT = 16
+
+
+async def timed_run(agent) -> float:
+    """Send one probe message and return its latency in seconds."""
+    start = time.perf_counter()
+    await agent.run("What is 2+2? Answer with just the number.")
+    return time.perf_counter() - start
+
 
 async def main():
     settings = get_settings()
-    
+
     print("Testing Azure OpenAI Connection")
     print("=" * 50)
     print(f"Endpoint: {settings.azure_openai_endpoint}")
@@ -17,31 +33,39 @@ async def main():
     print(f"Model: {settings.model_deployment_name}")
     print(f"API Version: {settings.azure_openai_api_version}")
     print("=" * 50)
-    
+
     try:
         print("\nCreating client...")
-        client = AzureOpenAIResponsesClient(
-            credential=DefaultAzureCredential(),
-            endpoint=settings.azure_openai_endpoint,
-            base_url=settings.azure_openai_base_url,
-            deployment_name=settings.model_deployment_name,
-            api_version=settings.azure_openai_api_version,
-        )
-        
+        client = await get_shared_responses_client(settings)
+
         print("Creating agent...")
         agent = client.create_agent(
             instructions="You are a helpful assistant. Answer briefly.",
         )
-        
+
         print("Sending test message...")
+        start = time.perf_counter()
         result = await agent.run("What is 2+2? Answer with just the number.")
-        
+        first = time.perf_counter() - start
+
         print(f"\n✓ Success! Response: {result.text}")
-        
+        print(f"  First request: {first * 1000:.0f} ms")
+
+        print(f"\nSending {PROBE_COUNT} concurrent probes...")
+        latencies = sorted(await asyncio.gather(*(timed_run(agent) for _ in range(PROBE_COUNT))))
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"  min: {latencies[0] * 1000:.0f} ms")
+        print(f"  p50: {latencies[len(latencies) // 2] * 1000:.0f} ms")
+        print(f"  p99: {p99 * 1000:.0f} ms")
+        print(f"  max: {latencies[-1] * 1000:.0f} ms")
+
     except Exception as e:
         print(f"\n✗ Error: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await close_shared_http_client()
+        close_shared_credential()
 
 
 if __name__ == "__main__":
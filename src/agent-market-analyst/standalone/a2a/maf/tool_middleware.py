@@ -0,0 +1,46 @@
+"""Tool concurrency middleware for Microsoft Agent Framework.
+
+The framework already dispatches all function calls emitted in one model
+turn concurrently with asyncio.gather. This module provides a
+FunctionMiddleware that caps how many of those calls are in flight at once,
+so a wide fan-out of MCP lookups cannot overwhelm the MCP servers.
+
+Based on Microsoft Agent Framework middleware patterns:
+https://learn.microsoft.com/en-us/agent-framework/user-guide/agents/agent-middleware
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from agent_framework import FunctionInvocationContext, FunctionMiddleware
+
+logger = logging.getLogger(__name__)
+
+
+class ToolConcurrencyMiddleware(FunctionMiddleware):
+    """Function middleware that limits concurrent tool invocations."""
+
+    def __init__(self, max_concurrent: int = 8) -> None:
+        """Initialize the middleware.
+
+        Args:
+            max_concurrent: Maximum number of tool calls executing at once.
+        """
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def process(
+        self,
+        context: FunctionInvocationContext,
+        next: Callable[[FunctionInvocationContext], Awaitable[None]],
+    ) -> None:
+        """Run the tool call once a concurrency slot is free."""
+        if self._semaphore.locked():
+            logger.debug(
+                "Tool %s waiting for a slot (%d concurrent)",
+                context.function.name,
+                self.max_concurrent,
+            )
+        async with self._semaphore:
+            await next(context)
@@ -8,11 +8,18 @@ OpenTelemetry traces still flow to App Insights for observability dashboards.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+import logging.handlers
+import os
+import queue
 import re
 import sys
+import time
+from collections import deque
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+from typing import Annotated, Any, AsyncGenerator, Awaitable, Callable
 
 
 # === Logging Configuration ===
@@ -20,38 +27,74 @@ from typing import Any, AsyncGenerator
 
 # Pattern for noisy polling endpoints we want to suppress at INFO level
 SCRATCHPAD_POLL_PATTERN = re.compile(
-    r'/research/sessions/[a-f0-9-]+/scratchpad/(plan|notes|draft)'
+    r'/research/sessions/[a-f0-9-]+/scratchpad(/(plan|notes|draft))?'
 )
 
 
 class SuppressScratchpadPollingFilter(logging.Filter):
     """Filter to suppress frequent scratchpad polling access logs."""
+
+    # Names of loggers this filter has been added to (see _configure_logging)
+    _installed_on: set[str] = set()
     
     def filter(self, record: logging.LogRecord) -> bool:
         """Return False to suppress, True to allow the log record."""
-        message = record.getMessage()
-        if SCRATCHPAD_POLL_PATTERN.search(message):
+        # uvicorn access records carry (client, method, path, version, status)
+        # as args - read the path directly instead of formatting the message
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3 and isinstance(args[2], str):
+            path = args[2]
+        else:
+            path = record.getMessage()
+        if "/scratchpad" not in path:
+            return True
+        if SCRATCHPAD_POLL_PATTERN.search(path):
+            # Suppress INFO level, but allow WARNING/ERROR through
             return record.levelno > logging.INFO
         return True
 
 
+# Background thread writing log records to stdout (started in _configure_logging)
+_log_listener: logging.handlers.QueueListener | None = None
+
+
 def _configure_logging() -> None:
     """Configure logging for the API worker process.
     
     This runs when api.py is imported by uvicorn, ensuring logging
     is properly configured in the worker process (not just the parent).
+
+    The root logger only enqueues records; a QueueListener thread owns the
+    stdout handler, so logging from the event loop (e.g. per SSE event)
+    never blocks on a console write.
     """
+    global _log_listener
+
     # Force reconfigure logging (override any existing config)
     root_logger = logging.getLogger()
     
     # Clear any existing handlers
     root_logger.handlers.clear()
     
-    # Configure with proper format and stdout handler
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    if _log_listener is not None:
+        _log_listener.stop()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+
+    # Configure root with the non-blocking queue handler. It only merges
+    # args into the message; the listener's handler applies the real format.
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
+        handlers=[queue_handler],
         force=True,  # Override any existing configuration
     )
     
@@ -63,10 +106,10 @@ def _configure_logging() -> None:
         logging.getLogger(name).setLevel(logging.WARNING)
     
     # Add filter to suppress scratchpad polling access logs
-    uvicorn_access_logger = logging.getLogger("uvicorn.access")
     # Avoid adding duplicate filters
-    if not any(isinstance(f, SuppressScratchpadPollingFilter) for f in uvicorn_access_logger.filters):
-        uvicorn_access_logger.addFilter(SuppressScratchpadPollingFilter())
+    if "uvicorn.access" not in SuppressScratchpadPollingFilter._installed_on:
+        logging.getLogger("uvicorn.access").addFilter(SuppressScratchpadPollingFilter())
+        SuppressScratchpadPollingFilter._installed_on.add("uvicorn.access")
 
 
 # Configure logging FIRST - before any other imports
@@ -74,10 +117,12 @@ _configure_logging()
 
 
 # Now import other modules (their loggers will inherit from root)
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from opentelemetry import trace
+from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
 from __init__ import __version__
@@ -90,6 +135,8 @@ from models import (
     QuestionsResponse,
     ResearchSession,
     SessionListResponse,
+    SSEEvent,
+    SSEEventType,
 )
 from orchestrator import AgentOrchestrator
 from telemetry import get_tracer, set_session_context
@@ -98,12 +145,211 @@ from telemetry import get_tracer, set_session_context
 logger = logging.getLogger(__name__)
 tracer = get_tracer(__name__)
 
-# SSE heartbeat interval in seconds (keeps connection alive during long operations)
+# SSE keep-alive interval in seconds (keeps connection alive during long
+# operations). sse-starlette sends a ": ping" comment frame at this interval.
 SSE_HEARTBEAT_INTERVAL = 15
 
+# Compact JSON for the hand-built SSE error payloads, matching Pydantic's
+# model_dump_json output for events. One shared encoder; non-ASCII text
+# (e.g. Czech error messages) is emitted as UTF-8 instead of \u escapes.
+_sse_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _sse_frame(event_id: int | None, event: str, data: bytes) -> bytes:
+    """Encode one SSE frame.
+
+    sse-starlette sends bytes items as-is, so prebuilt frames skip its
+    per-event line splitting and str-to-bytes re-encoding. ``data`` must be a
+    single line, which compact JSON always is. A frame without an id leaves
+    the client's Last-Event-ID unchanged.
+    """
+    if event_id is None:
+        return b"event: %s\r\ndata: %s\r\n\r\n" % (event.encode(), data)
+    return b"id: %d\r\nevent: %s\r\ndata: %s\r\n\r\n" % (event_id, event.encode(), data)
+
+
+# Workflow events already waiting on a client's queue are joined into one
+# write of up to this many frames instead of one send per event
+SSE_BATCH_MAX = 16
+
+# Recent frames kept per session, so a client reconnecting with Last-Event-ID
+# replays what it missed instead of restarting the workflow
+SSE_REPLAY_BUFFER_SIZE = 100
+
+# Frames carrying workflow state (tool calls, scratchpad updates, results) are
+# also kept in a larger buffer that progress chunks cannot evict. Only when
+# that buffer overflows is a reconnecting client told to resync.
+SSE_KEY_FRAME_BUFFER_SIZE = 1000
+
+# High-rate streaming text chunks; losing some of them on reconnect only
+# shortens a live preview, so they are not kept as key frames
+SSE_PROGRESS_EVENT_TYPES = frozenset({"agent_progress", "subagent_progress", "synthesis_progress"})
+
+# A running workflow with no client attached is cancelled after this many
+# seconds; a finished session's frames are kept this long for late reconnects
+SSE_DETACHED_GRACE_SECONDS = 60
+
+# A client whose queue stays full this many seconds is disconnected so it
+# stops holding the workflow back; it resumes from the replay buffer when it
+# reconnects
+SSE_SLOW_CLIENT_TIMEOUT = 10.0
+
+# Wakes a client's stream loop to re-check whether it should stop
+_WORKFLOW_DONE = object()
+
+
+class _SessionStream:
+    """Fan-out of one session's SSE frames with a bounded replay buffer.
+
+    The workflow runs in its own task and publishes numbered frames here.
+    Each connected client reads from its own bounded queue, so a slow client
+    holds the workflow back for at most SSE_SLOW_CLIENT_TIMEOUT before it is
+    disconnected. A dropped client can reconnect and resume after the last
+    frame id it received; if state-carrying frames it missed are no longer
+    buffered, it gets a resync event first so it refetches session state.
+    """
+
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+        self._recent_frames: deque[tuple[int, bytes]] = deque(maxlen=SSE_REPLAY_BUFFER_SIZE)
+        self._key_frames: deque[tuple[int, bytes]] = deque(maxlen=SSE_KEY_FRAME_BUFFER_SIZE)
+        # Id of the newest key frame dropped from _key_frames
+        self._evicted_key_id = 0
+        self.last_id = 0
+        self.done = False
+        self.task: asyncio.Task[None] | None = None
+        self._subscribers: set[asyncio.Queue[Any]] = set()
+        self._detach_timer: asyncio.TimerHandle | None = None
+
+    def start(self, workflow: Awaitable[None]) -> None:
+        """Run the workflow task; it is cancelled if no client attaches in time."""
+        self.task = asyncio.create_task(workflow)
+        self._arm_detach_timer()
+
+    async def publish(self, event_type: str, data: bytes) -> None:
+        """Number and buffer a frame, then hand it to every attached client."""
+        self.last_id += 1
+        frame = _sse_frame(self.last_id, event_type, data)
+        self._recent_frames.append((self.last_id, frame))
+        if event_type not in SSE_PROGRESS_EVENT_TYPES:
+            if len(self._key_frames) == SSE_KEY_FRAME_BUFFER_SIZE:
+                self._evicted_key_id = self._key_frames[0][0]
+            self._key_frames.append((self.last_id, frame))
+        for client_queue in tuple(self._subscribers):
+            try:
+                async with asyncio.timeout(SSE_SLOW_CLIENT_TIMEOUT):
+                    await client_queue.put(frame)
+            except TimeoutError:
+                logger.warning(
+                    "Disconnecting slow SSE client of session %s after %ss of backpressure",
+                    self.session_id[:8],
+                    SSE_SLOW_CLIENT_TIMEOUT,
+                )
+                self._subscribers.discard(client_queue)
+                self._wake(client_queue)
+                if not self._subscribers:
+                    self._arm_detach_timer()
+
+    def close(self) -> None:
+        """Mark the stream finished and wake every attached client."""
+        self.done = True
+        if self._detach_timer is not None:
+            self._detach_timer.cancel()
+            self._detach_timer = None
+        for client_queue in self._subscribers:
+            self._wake(client_queue)
+
+    @staticmethod
+    def _wake(client_queue: asyncio.Queue[Any]) -> None:
+        try:
+            client_queue.put_nowait(_WORKFLOW_DONE)
+        except asyncio.QueueFull:
+            # The client is busy with queued frames and sees the flag next
+            pass
+
+    async def subscribe(self, after_id: int) -> AsyncGenerator[bytes, None]:
+        """Yield buffered frames newer than ``after_id``, then live frames."""
+        client_queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=SSE_BATCH_MAX)
+        missed = self._replay(after_id)
+        if after_id < self._evicted_key_id:
+            logger.warning(
+                "Session %s resumed after frame %d, older than the replay buffer - requesting resync",
+                self.session_id[:8],
+                after_id,
+            )
+            resync_event = SSEEvent(
+                event_type=SSEEventType.RESYNC,
+                session_id=self.session_id,
+                data={"after_id": after_id},
+            )
+            missed.insert(0, _sse_frame(None, "resync", resync_event.json_bytes()))
+        if not self.done:
+            self._subscribers.add(client_queue)
+            if self._detach_timer is not None:
+                self._detach_timer.cancel()
+                self._detach_timer = None
+        try:
+            if missed:
+                yield b"".join(missed)
+            while True:
+                # Finished or disconnected as a slow client: send what is queued
+                if (self.done or client_queue not in self._subscribers) and client_queue.empty():
+                    return
+                frame = await client_queue.get()
+                if frame is _WORKFLOW_DONE:
+                    continue
+                # Send this frame and any already queued behind it in one write
+                frames = [frame]
+                while len(frames) < SSE_BATCH_MAX and not client_queue.empty():
+                    frame = client_queue.get_nowait()
+                    if frame is _WORKFLOW_DONE:
+                        break
+                    frames.append(frame)
+                yield frames[0] if len(frames) == 1 else b"".join(frames)
+        finally:
+            attached = client_queue in self._subscribers
+            self._subscribers.discard(client_queue)
+            # Unblock a publish() waiting on this client's full queue
+            while not client_queue.empty():
+                client_queue.get_nowait()
+            if attached and not self._subscribers and not self.done:
+                self._arm_detach_timer()
+
+    def _replay(self, after_id: int) -> list[bytes]:
+        """Buffered frames newer than ``after_id``, in id order.
+
+        Key frames older than the recent buffer come first, then every recent
+        frame; progress chunks that only lived in the recent buffer are gone.
+        """
+        recent_start = self._recent_frames[0][0] if self._recent_frames else self.last_id + 1
+        frames = [
+            frame for frame_id, frame in self._key_frames
+            if after_id < frame_id < recent_start
+        ]
+        frames.extend(frame for frame_id, frame in self._recent_frames if frame_id > after_id)
+        return frames
+
+    def _arm_detach_timer(self) -> None:
+        if self._detach_timer is not None:
+            self._detach_timer.cancel()
+        if self.task is not None:
+            self._detach_timer = asyncio.get_running_loop().call_later(
+                SSE_DETACHED_GRACE_SECONDS, self.task.cancel
+            )
+
+
+# Live and recently finished session streams, by session ID
+_session_streams: dict[str, _SessionStream] = {}
+
 # Global orchestrator instance (initialized in lifespan)
 _orchestrator: AgentOrchestrator | None = None
 
+# Health results are reused for this many seconds so frequent liveness and
+# readiness probes share one check
+HEALTH_CACHE_TTL = 5.0
+_health_cache: tuple[float, dict[str, Any]] | None = None
+_health_lock = asyncio.Lock()
+
 
 def get_orchestrator() -> AgentOrchestrator:
     """Get the global orchestrator instance."""
@@ -112,14 +358,56 @@ def get_orchestrator() -> AgentOrchestrator:
     return _orchestrator
 
 
+# Handlers receive the orchestrator through FastAPI dependency injection
+OrchestratorDep = Annotated[AgentOrchestrator, Depends(get_orchestrator)]
+
+
+async def _cached_health(orchestrator: AgentOrchestrator) -> dict[str, Any]:
+    """Get orchestrator health, reusing a result younger than HEALTH_CACHE_TTL.
+
+    Concurrent probes on a stale cache wait for a single check instead of
+    each running their own.
+    """
+    global _health_cache
+    if _health_cache is not None and time.monotonic() - _health_cache[0] < HEALTH_CACHE_TTL:
+        return _health_cache[1]
+    async with _health_lock:
+        if _health_cache is not None and time.monotonic() - _health_cache[0] < HEALTH_CACHE_TTL:
+            return _health_cache[1]
+        health_data = await orchestrator.check_health()
+        _health_cache = (time.monotonic(), health_data)
+        return health_data
+
+
+def _require_session(orchestrator: AgentOrchestrator, session_id: str) -> ResearchSession:
+    """Get a session by ID, raising 404 if it does not exist."""
+    session = orchestrator.get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+    return session
+
+
+def _model_response(model: BaseModel, headers: dict[str, str] | None = None) -> Response:
+    """Serialize a model straight to JSON bytes with pydantic-core.
+
+    Skips FastAPI's response validation and jsonable_encoder pass; the
+    route's response_model still documents the shape.
+    """
+    return Response(
+        content=model.__pydantic_serializer__.to_json(model),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
     global _orchestrator
 
     settings = get_settings()
-    logger.info(f"Starting Research Orchestrator v{__version__}")
-    logger.info(f"Foundry endpoint: {settings.azure_ai_foundry_endpoint}")
+    logger.info("Starting Research Orchestrator v%s", __version__)
+    logger.info("Foundry endpoint: %s", settings.azure_ai_foundry_endpoint)
 
     # Initialize orchestrator
     _orchestrator = AgentOrchestrator(settings)
@@ -128,10 +416,40 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     # Cleanup
+    workflow_tasks = [
+        stream.task for stream in _session_streams.values()
+        if stream.task is not None and not stream.task.done()
+    ]
+    for task in workflow_tasks:
+        task.cancel()
+    await asyncio.gather(*workflow_tasks, return_exceptions=True)
+
     if _orchestrator:
         await _orchestrator.__aexit__(None, None, None)
     logger.info("Research Orchestrator shutdown complete")
 
+    # Flush queued log records last so shutdown messages are written
+    _stop_log_listener()
+
+
+def _stop_log_listener() -> None:
+    """Stop the background log listener and give the root logger its handlers back.
+
+    The QueueHandler is swapped for the listener's stream handler before
+    the listener is stopped, so records logged afterwards are still written
+    and none are left in the queue.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root_logger.removeHandler(handler)
+        for handler in _log_listener.handlers:
+            root_logger.addHandler(handler)
+        _log_listener.stop()
+        _log_listener = None
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -141,39 +459,64 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# CORS middleware for web UI
+# Browsers may reuse a preflight result for this many seconds
+CORS_MAX_AGE = 86400
+
+
+def _get_cors_origins() -> list[str]:
+    """Read allowed browser origins from CORS_ALLOWED_ORIGINS (comma-separated).
+
+    Read from the environment rather than Settings because the middleware is
+    installed at import time, before settings are loaded in the lifespan.
+    Defaults to any origin.
+    """
+    raw = os.getenv("CORS_ALLOWED_ORIGINS", "")
+    return [origin.strip() for origin in raw.split(",") if origin.strip()] or ["*"]
+
+
+# CORS middleware for web UI. Explicit methods and headers let browsers cache
+# the preflight for CORS_MAX_AGE instead of repeating it per request.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Restrict in production
+    allow_origins=_get_cors_origins(),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type", "Last-Event-ID"],
+    max_age=CORS_MAX_AGE,
 )
 
+# Compress larger JSON responses (session lists, scratchpad contents).
+# Starlette never compresses text/event-stream, so SSE is unaffected.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 # === Health Endpoints ===
 
 
 @app.get("/health", response_model=HealthStatus, tags=["Health"])
-async def health_check() -> HealthStatus:
-    """Check API health and Foundry connectivity."""
-    orchestrator = get_orchestrator()
-    health_data = await orchestrator.check_health()
-
-    return HealthStatus(
-        status="healthy",
-        version=__version__,
-        foundry_endpoint=health_data["foundry_endpoint"],
-        model_deployment=health_data["model_deployment"],
+async def health_check(orchestrator: OrchestratorDep) -> Response:
+    """Check API health and Foundry connectivity.
+
+    Runs the orchestrator health check through the shared health cache, so
+    probes still reflect orchestrator state without each running a check.
+    """
+    health_data = await _cached_health(orchestrator)
+
+    return _model_response(
+        HealthStatus(
+            status="healthy",
+            version=__version__,
+            foundry_endpoint=health_data["foundry_endpoint"],
+            model_deployment=health_data["model_deployment"],
+        )
     )
 
 
 @app.get("/health/detailed", tags=["Health"])
-async def health_check_detailed() -> dict[str, Any]:
+async def health_check_detailed(orchestrator: OrchestratorDep) -> dict[str, Any]:
     """Detailed health check including observability status."""
-    orchestrator = get_orchestrator()
-    settings = get_settings()
-    health_data = await orchestrator.check_health()
+    settings = orchestrator.settings
+    health_data = await _cached_health(orchestrator)
 
     return {
         "status": "healthy",
@@ -190,21 +533,25 @@ async def health_check_detailed() -> dict[str, Any]:
     }
 
 
+# The root payload never changes, so it is encoded once at import
+_ROOT_BODY = json.dumps({
+    "service": "research-orchestrator",
+    "version": __version__,
+    "docs": "/docs",
+}).encode()
+
+
 @app.get("/", tags=["Health"])
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint with API info."""
-    return {
-        "service": "research-orchestrator",
-        "version": __version__,
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # === Session Endpoints ===
 
 
 @app.post("/research/sessions", response_model=ResearchSession, tags=["Research"])
-async def create_session(request: CreateSessionRequest) -> ResearchSession:
+async def create_session(request: CreateSessionRequest, orchestrator: OrchestratorDep) -> Response:
     """Create a new research session.
 
     Creates a pending session that can be started later. The session will
@@ -212,12 +559,11 @@ async def create_session(request: CreateSessionRequest) -> ResearchSession:
 
     Args:
         request: The session creation request with query, optional context, and language.
+        orchestrator: The orchestrator instance, injected by FastAPI.
 
     Returns:
         The created session with its ID.
     """
-    orchestrator = get_orchestrator()
-    
     with tracer.start_as_current_span("create_research_session") as span:
         session = orchestrator.create_session(
             query=request.query, context=request.context, language=request.language
@@ -225,24 +571,57 @@ async def create_session(request: CreateSessionRequest) -> ResearchSession:
         set_session_context(span, session.session_id, request.query)
         span.set_attribute("session.status", session.status)
         span.set_attribute("session.language", session.language)
-        logger.info(f"Created session {session.session_id} with query: {request.query[:100]}... (language={session.language})")
-        return session
+        logger.info(
+            "Created session %s with query: %s... (language=%s)",
+            session.session_id,
+            request.query[:100],
+            session.language,
+        )
+        return _model_response(session)
 
 
 @app.get("/research/sessions", response_model=SessionListResponse, tags=["Research"])
-async def list_sessions() -> SessionListResponse:
-    """List all research sessions."""
-    orchestrator = get_orchestrator()
+async def list_sessions(
+    request: Request,
+    orchestrator: OrchestratorDep,
+    limit: int | None = Query(default=None, ge=1),
+    offset: int = Query(default=0, ge=0),
+) -> Response:
+    """List research sessions, optionally one page at a time.
+
+    All sessions are returned unless a limit is given. The response carries
+    a weak ETag hashed from the serialized body; a request whose
+    If-None-Match matches it gets an empty 304 instead of the body.
+
+    Args:
+        request: The HTTP request (for If-None-Match).
+        orchestrator: The orchestrator instance, injected by FastAPI.
+        limit: Maximum number of sessions to return (default: all).
+        offset: Number of sessions to skip.
+
+    Returns:
+        The requested sessions and the total session count.
+    """
     sessions = orchestrator.list_sessions()
-    return SessionListResponse(sessions=sessions, total=len(sessions))
+    page = sessions[offset:] if limit is None else sessions[offset:offset + limit]
+
+    # Sessions are already validated models owned by the orchestrator
+    listing = SessionListResponse.model_construct(sessions=page, total=len(sessions))
+    response = _model_response(listing)
+    etag = f'W/"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
 
 
 @app.get("/research/sessions/{session_id}", response_model=ResearchSession, tags=["Research"])
-async def get_session(session_id: str) -> ResearchSession:
+async def get_session(session_id: str, orchestrator: OrchestratorDep) -> Response:
     """Get a specific research session by ID.
 
     Args:
         session_id: The session ID to retrieve.
+        orchestrator: The orchestrator instance, injected by FastAPI.
 
     Returns:
         The session if found.
@@ -250,15 +629,119 @@ async def get_session(session_id: str) -> ResearchSession:
     Raises:
         HTTPException: If session not found.
     """
-    orchestrator = get_orchestrator()
-    session = orchestrator.get_session(session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
-    return session
+    return _model_response(_require_session(orchestrator, session_id))
+
+
+async def _run_session_workflow(
+    stream: _SessionStream,
+    orchestrator: AgentOrchestrator,
+    session_query: str,
+) -> None:
+    """Run a session's workflow and publish its events to the session stream.
+    
+    ADR-007: Events are generated directly by the orchestrator middleware,
+    providing real-time updates. OpenTelemetry traces still flow to App Insights
+    for observability, but are not used for UI events.
+    
+    Creates a parent span "research_session" that encompasses the entire
+    workflow. This span's operation_Id is used to correlate all traces
+    in Application Insights for debugging and dashboards.
+    
+    Runs in its own task rather than in the SSE response, so a client that
+    drops and reconnects does not end the workflow.
+    """
+    session_id = stream.session_id
+    # Short session ID for per-event log lines, sliced once per session
+    short_session_id = session_id[:8]
+    
+    # Create parent span for entire research session
+    # This provides the operation_Id for all trace correlation in App Insights
+    with tracer.start_as_current_span("research_session") as session_span:
+        set_session_context(session_span, session_id, session_query)
+        session_span.set_attribute("workflow.type", "research")
+        
+        # Get the trace context for logging/debugging
+        span_context = session_span.get_span_context()
+        operation_id = format(span_context.trace_id, "032x") if span_context.is_valid else "unknown"
+        logger.info(
+            "Research session start: session=%s operation_id=%s query=%s...",
+            session_id,
+            operation_id,
+            session_query[:100],
+        )
+        
+        # Emit workflow_started with operation_id for trace correlation
+        workflow_started_event = SSEEvent(
+            event_type=SSEEventType.WORKFLOW_STARTED,
+            session_id=session_id,
+            data={
+                "session_id": session_id,
+                "operation_id": operation_id,
+            },
+        )
+        logger.info("SSE EMIT: workflow_started - session=%s", short_session_id)
+        await stream.publish("workflow_started", workflow_started_event.json_bytes())
+        
+        workflow_gen = orchestrator.run_research_workflow(session_id)
+        
+        try:
+            async for workflow_event in workflow_gen:
+                event_type = workflow_event.event_type.value
+                # Log high-frequency events at DEBUG, key events at INFO
+                if event_type == "subagent_progress":
+                    logger.debug("SSE EMIT: %s - session=%s", event_type, short_session_id)
+                else:
+                    logger.info("SSE EMIT: %s - session=%s", event_type, short_session_id)
+                await stream.publish(event_type, workflow_event.json_bytes())
+            
+            logger.info("Workflow generator exhausted for session %s", short_session_id)
+            session_span.set_attribute("workflow.completed", True)
+            logger.info("=== RESEARCH SESSION COMPLETE === session=%s", short_session_id)
+                    
+        except asyncio.CancelledError:
+            logger.warning(
+                "Workflow for session %s cancelled (no client attached or server shutdown)", session_id
+            )
+            session_span.set_attribute("workflow.disconnect", True)
+            raise
+        except RuntimeError as e:
+            # Handle cross-task cancel scope errors from MCP cleanup
+            if "cancel scope" in str(e):
+                logger.debug("Ignoring cross-task cancel scope during workflow: %s", e)
+            else:
+                logger.exception("RuntimeError in workflow for session %s", session_id)
+                session_span.record_exception(e)
+                await stream.publish("error", _sse_json({"error": str(e)}).encode())
+        except Exception as e:
+            logger.exception("Error in workflow for session %s", session_id)
+            session_span.record_exception(e)
+            await stream.publish("error", _sse_json({"error": str(e)}).encode())
+        finally:
+            # Explicitly close the workflow generator
+            try:
+                await workflow_gen.aclose()
+            except RuntimeError as e:
+                if "cancel scope" in str(e):
+                    logger.debug("Ignoring cross-task cancel scope during generator close: %s", e)
+                else:
+                    logger.debug("Error closing workflow generator: %s", e)
+            except Exception as e:
+                logger.debug("Error closing workflow generator: %s", e)
+            
+            stream.close()
+            # Keep the finished stream around briefly for clients reconnecting
+            asyncio.get_running_loop().call_later(
+                SSE_DETACHED_GRACE_SECONDS, _session_streams.pop, session_id, None
+            )
+            logger.info("Workflow task cleanup complete for session %s", short_session_id)
 
 
 @app.get("/research/sessions/{session_id}/start", tags=["Research"])
-async def start_session(session_id: str, request: Request) -> EventSourceResponse:
+async def start_session(
+    session_id: str,
+    orchestrator: OrchestratorDep,
+    last_event_id: Annotated[str | None, Header()] = None,
+) -> EventSourceResponse:
     """Start executing a research session with SSE progress streaming.
 
     This endpoint initiates the research workflow and streams progress
@@ -267,10 +750,15 @@ async def start_session(session_id: str, request: Request) -> EventSourceRespons
     
     Creates a parent span for the entire research session that provides
     the operation_Id for correlating all subagent traces in App Insights.
+    
+    Every frame carries an id. When EventSource reconnects it sends the
+    last id it received in the Last-Event-ID header, and the stream resumes
+    after that frame instead of starting the session again.
 
     Args:
         session_id: The session ID to start.
-        request: The HTTP request (for client disconnect detection).
+        orchestrator: The orchestrator instance, injected by FastAPI.
+        last_event_id: Id of the last frame received, sent on reconnect.
 
     Returns:
         SSE stream of workflow events.
@@ -278,183 +766,87 @@ async def start_session(session_id: str, request: Request) -> EventSourceRespons
     Raises:
         HTTPException: If session not found or already running.
     """
-    orchestrator = get_orchestrator()
-    session = orchestrator.get_session(session_id)
-
-    if not session:
-        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
-
-    if session.status != "pending":
+    session = _require_session(orchestrator, session_id)
+    stream = _session_streams.get(session_id)
+
+    if stream is not None and last_event_id is not None:
+        # Reconnect: resume after the last frame the client received
+        try:
+            after_id = int(last_event_id)
+        except ValueError:
+            after_id = 0
+        logger.info("SSE resume: session=%s after frame %d", session_id[:8], after_id)
+        return EventSourceResponse(stream.subscribe(after_id), ping=SSE_HEARTBEAT_INTERVAL)
+
+    if stream is not None or session.status != "pending":
         raise HTTPException(
             status_code=400,
             detail=f"Session {session_id} is already {session.status}",
         )
 
-    async def event_generator() -> AsyncGenerator[dict[str, Any], None]:
-        """Generate SSE events from workflow execution.
-        
-        ADR-007: Events are generated directly by the orchestrator middleware,
-        providing real-time updates. OpenTelemetry traces still flow to App Insights
-        for observability, but are not used for UI events.
-        
-        Creates a parent span "research_session" that encompasses the entire
-        workflow. This span's operation_Id is used to correlate all traces
-        in Application Insights for debugging and dashboards.
-        
-        Sends heartbeat events every SSE_HEARTBEAT_INTERVAL seconds to prevent
-        connection timeouts during long-running agent operations.
-        """
-        import json
-        from datetime import datetime, timezone
-        
-        # Create parent span for entire research session
-        # This provides the operation_Id for all trace correlation in App Insights
-        with tracer.start_as_current_span("research_session") as session_span:
-            set_session_context(session_span, session_id, session.query)
-            session_span.set_attribute("workflow.type", "research")
-            
-            # Get the trace context for logging/debugging
-            span_context = session_span.get_span_context()
-            operation_id = format(span_context.trace_id, "032x") if span_context.is_valid else "unknown"
-            logger.info(f"=== RESEARCH SESSION START ===")
-            logger.info(f"Session ID: {session_id}")
-            logger.info(f"Operation ID (trace_id): {operation_id}")
-            logger.info(f"Query: {session.query[:100]}...")
-            
-            # Emit workflow_started with operation_id for trace correlation
-            workflow_started_payload = {
-                "event_type": "workflow_started",
-                "session_id": session_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "data": {
-                    "session_id": session_id,
-                    "operation_id": operation_id,
-                },
-            }
-            logger.info(f"SSE EMIT: workflow_started - session={session_id[:8]}")
-            yield {
-                "event": "workflow_started",
-                "data": json.dumps(workflow_started_payload),
-            }
-            
-            workflow_gen = orchestrator.run_research_workflow(session_id)
-            workflow_exhausted = False
-            pending_event_task: asyncio.Task | None = None
-            
-            try:
-                while not workflow_exhausted:
-                    # Check if client disconnected
-                    if await request.is_disconnected():
-                        logger.warning(f"Client disconnected from session {session_id}")
-                        session_span.set_attribute("workflow.disconnect", True)
-                        break
-                    
-                    # Create task for next workflow event if not already pending
-                    if pending_event_task is None:
-                        pending_event_task = asyncio.create_task(workflow_gen.__anext__())
-                    
-                    # Wait for workflow event or heartbeat timeout
-                    done, _ = await asyncio.wait(
-                        {pending_event_task},
-                        timeout=SSE_HEARTBEAT_INTERVAL,
-                        return_when=asyncio.FIRST_COMPLETED
-                    )
-                    
-                    # Process completed workflow event
-                    if pending_event_task in done:
-                        try:
-                            event = pending_event_task.result()
-                            # Log high-frequency events at DEBUG, key events at INFO
-                            if event.event_type.value in ("subagent_progress", "heartbeat"):
-                                logger.debug(f"SSE EMIT: {event.event_type.value} - session={session_id[:8]}")
-                            else:
-                                logger.info(f"SSE EMIT: {event.event_type.value} - session={session_id[:8]}")
-                            yield {
-                                "event": event.event_type.value,
-                                "data": event.model_dump_json(),
-                            }
-                            pending_event_task = None  # Clear for next iteration
-                        except StopAsyncIteration:
-                            logger.info(f"Workflow generator exhausted for session {session_id[:8]}")
-                            workflow_exhausted = True
-                            pending_event_task = None
-                    else:
-                        # Timeout - send heartbeat
-                        logger.debug(f"SSE EMIT: heartbeat for session {session_id[:8]}")
-                        heartbeat_payload = {
-                            "event_type": "heartbeat",
-                            "session_id": session_id,
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "data": {
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
-                            },
-                        }
-                        yield {
-                            "event": "heartbeat",
-                            "data": json.dumps(heartbeat_payload),
-                        }
-                
-                session_span.set_attribute("workflow.completed", True)
-                logger.info(f"=== RESEARCH SESSION COMPLETE === session={session_id[:8]}")
-                        
-            except RuntimeError as e:
-                # Handle cross-task cancel scope errors from MCP cleanup
-                if "cancel scope" in str(e):
-                    logger.debug(f"Ignoring cross-task cancel scope during SSE generator: {e}")
-                else:
-                    logger.exception(f"RuntimeError in workflow for session {session_id}")
-                    session_span.record_exception(e)
-                    yield {
-                        "event": "error",
-                        "data": f'{{"error": "{str(e)}"}}',
-                    }
-            except Exception as e:
-                logger.exception(f"Error in workflow for session {session_id}")
-                session_span.record_exception(e)
-                yield {
-                    "event": "error",
-                    "data": f'{{"error": "{str(e)}"}}',
-                }
-            finally:
-                # Cancel any pending tasks
-                if pending_event_task and not pending_event_task.done():
-                    pending_event_task.cancel()
-                    try:
-                        await pending_event_task
-                    except (asyncio.CancelledError, StopAsyncIteration):
-                        pass
-                
-                # Explicitly close the workflow generator
-                try:
-                    await workflow_gen.aclose()
-                except RuntimeError as e:
-                    if "cancel scope" in str(e):
-                        logger.debug(f"Ignoring cross-task cancel scope during generator close: {e}")
-                    else:
-                        logger.debug(f"Error closing workflow generator: {e}")
-                except Exception as e:
-                    logger.debug(f"Error closing workflow generator: {e}")
-                
-                logger.info(f"SSE generator cleanup complete for session {session_id[:8]}")
-
-    return EventSourceResponse(event_generator())
+    stream = _SessionStream(session_id)
+    _session_streams[session_id] = stream
+    stream.start(_run_session_workflow(stream, orchestrator, session.query))
+
+    return EventSourceResponse(stream.subscribe(0), ping=SSE_HEARTBEAT_INTERVAL)
 
 
 # === Scratchpad Proxy Endpoints ===
 
+# Scratchpad payloads are plain JSON parsed from MCP tool output, so the
+# endpoints return JSONResponse directly and skip FastAPI's jsonable_encoder
+# and response validation walk over every task, note, and draft section.
+#
+# Scratchpad reads are polled by every client watching a session. Concurrent
+# reads of the same (session_id, resource) share one in-flight MCP call, and
+# a result is reused for SCRATCHPAD_CACHE_TTL seconds after it completes.
+SCRATCHPAD_CACHE_TTL = 0.5
+_scratchpad_reads: dict[tuple[str, str], asyncio.Task[dict[str, Any]]] = {}
+
+
+async def _coalesced_scratchpad_read(
+    session_id: str,
+    resource: str,
+    fetch: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Read a scratchpad resource, sharing in-flight and just-finished reads.
+
+    Failed reads are not reused; the next caller starts a new one.
+    """
+    key = (session_id, resource)
+    task = _scratchpad_reads.get(key)
+    if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+        task = asyncio.ensure_future(fetch())
+        _scratchpad_reads[key] = task
+        task.add_done_callback(lambda t: _expire_scratchpad_read(key, t))
+    # Shield so one client disconnecting does not cancel the read for others
+    return await asyncio.shield(task)
+
+
+def _expire_scratchpad_read(key: tuple[str, str], task: asyncio.Task[dict[str, Any]]) -> None:
+    """Drop a finished read from the cache once its TTL has passed."""
+    def _drop() -> None:
+        if _scratchpad_reads.get(key) is task:
+            del _scratchpad_reads[key]
+
+    asyncio.get_running_loop().call_later(SCRATCHPAD_CACHE_TTL, _drop)
 
-@app.get("/research/sessions/{session_id}/scratchpad/plan", tags=["Research", "Scratchpad"])
-async def get_plan(session_id: str) -> dict[str, Any]:
+
+@app.get("/research/sessions/{session_id}/scratchpad/plan", tags=["Research", "Scratchpad"], deprecated=True)
+async def get_plan(session_id: str, orchestrator: OrchestratorDep) -> JSONResponse:
     """Get current research plan with all tasks.
     
     Returns the current plan with all tasks, their statuses, assignments, and priorities.
-    Frontend should poll this endpoint after each SSE event to get the current state.
+    Clients refreshing the whole scratchpad should prefer the combined
+    /research/sessions/{id}/scratchpad endpoint, which returns plan, notes
+    and draft in one request.
     This proxies to the MCP scratchpad read_plan tool.
     
     SECURITY: Uses session-scoped MCP tool with X-Session-ID header for isolation.
 
     Args:
         session_id: The session ID.
+        orchestrator: The orchestrator instance, injected by FastAPI.
 
     Returns:
         Plan with tasks array and metadata.
@@ -462,35 +854,33 @@ async def get_plan(session_id: str) -> dict[str, Any]:
     Raises:
         HTTPException: If session not found or scratchpad unavailable.
     """
-    orchestrator = get_orchestrator()
-    session = orchestrator.get_session(session_id)
-
-    if not session:
-        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+    _require_session(orchestrator, session_id)
 
     try:
         # Pass actual session_id for isolation
-        plan_data = await orchestrator.get_scratchpad_plan(session_id=session_id)
-        return {
-            "session_id": session_id,
-            **plan_data,
-        }
+        plan_data = await _coalesced_scratchpad_read(
+            session_id, "plan", lambda: orchestrator.get_scratchpad_plan(session_id=session_id)
+        )
+        return JSONResponse({"session_id": session_id, **plan_data})
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
 
 
-@app.get("/research/sessions/{session_id}/scratchpad/notes", tags=["Research", "Scratchpad"])
-async def get_notes(session_id: str) -> dict[str, Any]:
+@app.get("/research/sessions/{session_id}/scratchpad/notes", tags=["Research", "Scratchpad"], deprecated=True)
+async def get_notes(session_id: str, orchestrator: OrchestratorDep) -> JSONResponse:
     """Get all research notes.
     
     Returns all notes collected during research, organized by author.
-    Frontend should poll this endpoint after each SSE event to get current state.
+    Clients refreshing the whole scratchpad should prefer the combined
+    /research/sessions/{id}/scratchpad endpoint, which returns plan, notes
+    and draft in one request.
     This proxies to the MCP scratchpad read_notes tool.
     
     SECURITY: Uses session-scoped MCP tool with X-Session-ID header for isolation.
 
     Args:
         session_id: The session ID.
+        orchestrator: The orchestrator instance, injected by FastAPI.
 
     Returns:
         Notes array with metadata.
@@ -498,35 +888,33 @@ async def get_notes(session_id: str) -> dict[str, Any]:
     Raises:
         HTTPException: If session not found or scratchpad unavailable.
     """
-    orchestrator = get_orchestrator()
-    session = orchestrator.get_session(session_id)
-
-    if not session:
-        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+    _require_session(orchestrator, session_id)
 
     try:
         # Pass actual session_id for isolation
-        notes_data = await orchestrator.get_scratchpad_notes(session_id=session_id)
-        return {
-            "session_id": session_id,
-            **notes_data,
-        }
+        notes_data = await _coalesced_scratchpad_read(
+            session_id, "notes", lambda: orchestrator.get_scratchpad_notes(session_id=session_id)
+        )
+        return JSONResponse({"session_id": session_id, **notes_data})
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
 
 
-@app.get("/research/sessions/{session_id}/scratchpad/draft", tags=["Research", "Scratchpad"])
-async def get_draft(session_id: str) -> dict[str, Any]:
+@app.get("/research/sessions/{session_id}/scratchpad/draft", tags=["Research", "Scratchpad"], deprecated=True)
+async def get_draft(session_id: str, orchestrator: OrchestratorDep) -> JSONResponse:
     """Get current draft report sections.
     
     Returns all draft sections written so far.
-    Frontend should poll this endpoint after each SSE event to get current state.
+    Clients refreshing the whole scratchpad should prefer the combined
+    /research/sessions/{id}/scratchpad endpoint, which returns plan, notes
+    and draft in one request.
     This proxies to the MCP scratchpad read_draft tool.
     
     SECURITY: Uses session-scoped MCP tool with X-Session-ID header for isolation.
 
     Args:
         session_id: The session ID.
+        orchestrator: The orchestrator instance, injected by FastAPI.
 
     Returns:
         Draft sections array with metadata.
@@ -534,28 +922,71 @@ async def get_draft(session_id: str) -> dict[str, Any]:
     Raises:
         HTTPException: If session not found or scratchpad unavailable.
     """
-    orchestrator = get_orchestrator()
-    session = orchestrator.get_session(session_id)
-
-    if not session:
-        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+    _require_session(orchestrator, session_id)
 
     try:
         # Pass actual session_id for isolation
-        draft_data = await orchestrator.get_scratchpad_draft(session_id=session_id)
-        return {
-            "session_id": session_id,
-            **draft_data,
-        }
+        draft_data = await _coalesced_scratchpad_read(
+            session_id, "draft", lambda: orchestrator.get_scratchpad_draft(session_id=session_id)
+        )
+        return JSONResponse({"session_id": session_id, **draft_data})
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
 
 
+
+@app.get("/research/sessions/{session_id}/scratchpad", tags=["Research", "Scratchpad"])
+async def get_scratchpad(session_id: str, orchestrator: OrchestratorDep) -> JSONResponse:
+    """Get plan, notes, and draft in one response.
+    
+    Lets the frontend refresh all three scratchpad panels with a single request
+    after each SSE event. The three reads run concurrently and share in-flight
+    reads with the per-resource endpoints.
+    
+    SECURITY: Uses session-scoped MCP tool with X-Session-ID header for isolation.
+
+    Args:
+        session_id: The session ID.
+        orchestrator: The orchestrator instance, injected by FastAPI.
+
+    Returns:
+        Plan, notes, and draft, each shaped like its own endpoint's response,
+        or None where that read failed.
+
+    Raises:
+        HTTPException: If session not found.
+    """
+    _require_session(orchestrator, session_id)
+
+    # Pass actual session_id for isolation
+    results = await asyncio.gather(
+        _coalesced_scratchpad_read(
+            session_id, "plan", lambda: orchestrator.get_scratchpad_plan(session_id=session_id)
+        ),
+        _coalesced_scratchpad_read(
+            session_id, "notes", lambda: orchestrator.get_scratchpad_notes(session_id=session_id)
+        ),
+        _coalesced_scratchpad_read(
+            session_id, "draft", lambda: orchestrator.get_scratchpad_draft(session_id=session_id)
+        ),
+        return_exceptions=True,
+    )
+
+    response: dict[str, Any] = {"session_id": session_id}
+    for resource, result in zip(("plan", "notes", "draft"), results):
+        if isinstance(result, BaseException):
+            logger.warning("Scratchpad %s read failed for session %s: %s", resource, session_id[:8], result)
+            response[resource] = None
+        else:
+            response[resource] = {"session_id": session_id, **result}
+    return JSONResponse(response)
+
+
 # === Questions Endpoints (Human-in-the-Loop) ===
 
 
 @app.get("/research/sessions/{session_id}/questions", response_model=QuestionsResponse, tags=["Research", "Questions"])
-async def get_questions(session_id: str, status: str | None = None) -> QuestionsResponse:
+async def get_questions(session_id: str, orchestrator: OrchestratorDep, status: str | None = None) -> QuestionsResponse:
     """Get all questions for a session.
     
     Returns questions from agents that need user input. Frontend should poll
@@ -564,6 +995,7 @@ async def get_questions(session_id: str, status: str | None = None) -> Questions
     Args:
         session_id: The session ID.
         status: Optional filter - 'pending', 'answered', or 'all' (default).
+        orchestrator: The orchestrator instance, injected by FastAPI.
 
     Returns:
         Questions with workflow status.
@@ -571,31 +1003,31 @@ async def get_questions(session_id: str, status: str | None = None) -> Questions
     Raises:
         HTTPException: If session not found.
     """
-    orchestrator = get_orchestrator()
-    session = orchestrator.get_session(session_id)
-
-    if not session:
-        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+    _require_session(orchestrator, session_id)
 
     try:
         questions_data = await orchestrator.get_scratchpad_questions(session_id=session_id)
         
         all_questions = questions_data.get("questions", [])
         
-        # Apply status filter if provided
-        if status == "pending":
-            filtered_questions = [q for q in all_questions if not q.get("answered", False)]
-        elif status == "answered":
-            filtered_questions = [q for q in all_questions if q.get("answered", False)]
-        else:
-            filtered_questions = all_questions
-        
-        pending_count = sum(1 for q in all_questions if not q.get("answered", False))
-        answered_count = sum(1 for q in all_questions if q.get("answered", False))
-        has_blocking_pending = any(
-            q.get("priority") == "blocking" and not q.get("answered", False)
-            for q in all_questions
-        )
+        # Count, detect blocking questions, and apply the optional status
+        # filter in a single pass over the questions
+        want_pending = status == "pending"
+        want_answered = status == "answered"
+        filtered_questions = [] if want_pending or want_answered else all_questions
+        pending_count = answered_count = 0
+        has_blocking_pending = False
+        for q in all_questions:
+            if q.get("answered", False):
+                answered_count += 1
+                if want_answered:
+                    filtered_questions.append(q)
+            else:
+                pending_count += 1
+                if q.get("priority") == "blocking":
+                    has_blocking_pending = True
+                if want_pending:
+                    filtered_questions.append(q)
         
         # Check if workflow is waiting for input
         workflow_waiting = orchestrator.is_session_waiting_for_input(session_id)
@@ -613,7 +1045,7 @@ async def get_questions(session_id: str, status: str | None = None) -> Questions
 
 
 @app.post("/research/sessions/{session_id}/answers", response_model=AnswersResponse, tags=["Research", "Questions"])
-async def submit_answers(session_id: str, request: AnswersRequest) -> AnswersResponse:
+async def submit_answers(session_id: str, request: AnswersRequest, orchestrator: OrchestratorDep) -> AnswersResponse:
     """Submit answers to questions and unblock workflow.
     
     Submits user answers to one or more questions. If the workflow is currently
@@ -622,6 +1054,7 @@ async def submit_answers(session_id: str, request: AnswersRequest) -> AnswersRes
     Args:
         session_id: The session ID.
         request: The answers to submit.
+        orchestrator: The orchestrator instance, injected by FastAPI.
 
     Returns:
         Result with number of answers saved and workflow status.
@@ -629,11 +1062,7 @@ async def submit_answers(session_id: str, request: AnswersRequest) -> AnswersRes
     Raises:
         HTTPException: If session not found or error submitting answers.
     """
-    orchestrator = get_orchestrator()
-    session = orchestrator.get_session(session_id)
-
-    if not session:
-        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+    _require_session(orchestrator, session_id)
 
     try:
         # Convert request to format expected by MCP tool
@@ -651,7 +1080,7 @@ async def submit_answers(session_id: str, request: AnswersRequest) -> AnswersRes
             # Unblock the workflow
             orchestrator.unblock_session(session_id)
             workflow_unblocked = True
-            logger.info(f"Workflow unblocked for session {session_id}")
+            logger.info("Workflow unblocked for session %s", session_id)
         
         return AnswersResponse(
             session_id=session_id,
@@ -669,7 +1098,7 @@ async def submit_answers(session_id: str, request: AnswersRequest) -> AnswersRes
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Global exception handler."""
-    logger.exception(f"Unhandled exception: {exc}")
+    logger.exception("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "error": str(exc)},
@@ -189,6 +189,14 @@ class Settings(BaseSettings):
     api_host: str = Field(default="0.0.0.0", description="API host")
     api_port: int = Field(default=8000, description="API port")
     api_reload: bool = Field(default=False, description="Enable auto-reload for development")
+    api_access_log: bool = Field(
+        default=False,
+        description="Emit uvicorn per-request access logs (application logs are unaffected)",
+    )
+    api_proxy_headers: bool = Field(
+        default=False,
+        description="Trust X-Forwarded-* headers for client address and scheme",
+    )
 
     # Timeouts
     agent_timeout_seconds: int = Field(
@@ -286,7 +294,7 @@ class Settings(BaseSettings):
         return prompt_path.read_text(encoding="utf-8")
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
@@ -17,9 +17,9 @@ from config import get_settings
 
 
 # Pattern for noisy polling endpoints we want to suppress at INFO level
-# Matches scratchpad polling: /research/sessions/{uuid}/scratchpad/{plan|notes|draft}
+# Matches scratchpad polling: /research/sessions/{uuid}/scratchpad[/{plan|notes|draft}]
 SCRATCHPAD_POLL_PATTERN = re.compile(
-    r'/research/sessions/[a-f0-9-]+/scratchpad/(plan|notes|draft)'
+    r'/research/sessions/[a-f0-9-]+/scratchpad(/(plan|notes|draft))?'
 )
 
 
@@ -33,9 +33,16 @@ class SuppressScratchpadPollingFilter(logging.Filter):
     
     def filter(self, record: logging.LogRecord) -> bool:
         """Return False to suppress, True to allow the log record."""
-        # Check if this is an access log with a scratchpad polling path
-        message = record.getMessage()
-        if SCRATCHPAD_POLL_PATTERN.search(message):
+        # uvicorn access records carry (client, method, path, version, status)
+        # as args - read the path directly instead of formatting the message
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3 and isinstance(args[2], str):
+            path = args[2]
+        else:
+            path = record.getMessage()
+        if "/scratchpad" not in path:
+            return True
+        if SCRATCHPAD_POLL_PATTERN.search(path):
             # Suppress INFO level, but allow WARNING/ERROR through
             return record.levelno > logging.INFO
         return True
@@ -86,13 +93,19 @@ def main() -> None:
     logger.info(f"Host: {settings.api_host}")
     logger.info(f"Port: {settings.api_port}")
     logger.info(f"Reload: {settings.api_reload}")
+    logger.info(f"Access log: {settings.api_access_log}")
 
+    # Access logging and proxy-header parsing run on every request; both are
+    # off unless enabled, trading per-request log lines and forwarded client
+    # addresses for lower request overhead
     uvicorn.run(
         "api:app",
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_reload,
         log_level="info",
+        access_log=settings.api_access_log,
+        proxy_headers=settings.api_proxy_headers,
     )
 
 
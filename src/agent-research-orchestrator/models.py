@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 def utcnow() -> datetime:
@@ -109,7 +109,8 @@ class SSEEventType(str, Enum):
     - Agent operations: agent_started, agent_completed, agent_response, agent_progress
     - Tool calls: tool_call_started, tool_call_completed, tool_call_failed
     - Subagent operations: subagent_tool_started, subagent_tool_completed, subagent_progress
-    - Scratchpad: scratchpad_updated, scratchpad_snapshot
+    - Scratchpad: scratchpad_updated, scratchpad_snapshot,
+      plan_updated, notes_updated, draft_updated
     - Synthesis: synthesis_completed
     
     Observability-only events (NOT sent to UI, kept for potential future dashboards):
@@ -143,6 +144,9 @@ class SSEEventType(str, Enum):
     # Scratchpad operations (primary - from middleware)
     SCRATCHPAD_UPDATED = "scratchpad_updated"
     SCRATCHPAD_SNAPSHOT = "scratchpad_snapshot"
+    PLAN_UPDATED = "plan_updated"               # Full plan state after a write
+    NOTES_UPDATED = "notes_updated"             # Full notes state after a write
+    DRAFT_UPDATED = "draft_updated"             # Full draft state after a write
     
     # Questions (primary - human-in-the-loop)
     QUESTION_ADDED = "question_added"
@@ -156,6 +160,7 @@ class SSEEventType(str, Enum):
     
     # Connection management
     HEARTBEAT = "heartbeat"                       # Keep-alive signal
+    RESYNC = "resync"                             # Missed events lost; refetch state
     
     # Trace events (observability-only, NOT sent to UI - see ADR-007)
     TRACE_SPAN_STARTED = "trace_span_started"     # Agent/operation span began
@@ -171,9 +176,22 @@ class SSEEvent(BaseModel):
     timestamp: datetime = Field(default_factory=utcnow)
     data: dict[str, Any] = Field(default_factory=dict)
 
+    # Serialized JSON, filled in on first use by json_bytes()
+    _raw: bytes | None = PrivateAttr(default=None)
+
+    def json_bytes(self) -> bytes:
+        """Return the event as compact JSON bytes, serializing at most once.
+
+        Produces the same JSON as model_dump_json() without decoding it to str.
+        Events are not mutated after they are yielded, so the result is cached.
+        """
+        if self._raw is None:
+            self._raw = self.__pydantic_serializer__.to_json(self)
+        return self._raw
+
     def to_sse(self) -> str:
-        """Format as SSE message."""
-        return f"event: {self.event_type.value}\ndata: {self.model_dump_json()}\n\n"
+        """Format as SSE message, reusing the cached JSON from json_bytes()."""
+        return f"event: {self.event_type.value}\ndata: {self.json_bytes().decode()}\n\n"
 
 
 # === Trace Event Models (Observability-Only - ADR-007) ===
@@ -179,21 +179,44 @@ class SessionScopedMCPTool:
 
 # === Tool Call Event Queue ===
 
+# Events waiting for the streaming loop before producers have to wait. When a
+# slow SSE client stalls the loop, the agent run is paused instead of the
+# backlog growing without bound.
+TOOL_EVENT_QUEUE_MAXSIZE = 256
+
+# Progress text chunks are dropped rather than waited on when the queue is full
+DROPPABLE_TOOL_EVENT_TYPES = {"subagent_progress"}
+
+
 class ToolCallEventQueue:
     """Thread-safe queue for tool call events during streaming.
     
-    Middleware pushes events here; the streaming loop consumes them.
+    Middleware pushes events here, as does the task draining the agent
+    stream; the streaming loop consumes them.
     Events include detailed input/output data for SSE streaming.
     """
     
-    def __init__(self) -> None:
-        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    def __init__(self, maxsize: int = TOOL_EVENT_QUEUE_MAXSIZE) -> None:
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=maxsize)
         self._closed = False
+        self._dropped = 0
     
     async def put(self, event: dict[str, Any]) -> None:
-        """Add a tool call event to the queue."""
-        if not self._closed:
-            await self._queue.put(event)
+        """Add a tool call event to the queue, waiting while it is full.
+        
+        Droppable progress events are discarded instead of waiting.
+        """
+        if self._closed:
+            return
+        if event["type"] in DROPPABLE_TOOL_EVENT_TYPES:
+            try:
+                self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                if self._dropped == 0:
+                    logger.warning("Tool event queue full - dropping progress events until the stream catches up")
+                self._dropped += 1
+            return
+        await self._queue.put(event)
     
     def get_nowait(self) -> dict[str, Any] | None:
         """Get an event without waiting. Returns None if empty."""
@@ -620,7 +643,7 @@ def create_subagent_stream_callback(
                         input_preview=input_preview,
                     ),
                     "session_id": session_id,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": datetime.now(timezone.utc),
                 })
                 logger.debug(f"Subagent {subagent_name} calling tool: {tool_name}")
             
@@ -657,7 +680,7 @@ def create_subagent_stream_callback(
                         output_preview=output_preview,
                     ),
                     "session_id": session_id,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": datetime.now(timezone.utc),
                 })
                 logger.debug(f"Subagent {subagent_name} tool completed: {tool_name}")
             
@@ -674,7 +697,7 @@ def create_subagent_stream_callback(
                                 text_chunk=text[:500],  # Limit chunk size
                             ),
                             "session_id": session_id,
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
+                            "timestamp": datetime.now(timezone.utc),
                         })
     
     return stream_callback
@@ -805,7 +828,7 @@ def create_tool_call_middleware(
                     input_args=input_args,
                 ),
                 "call_number": call_number,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": datetime.now(timezone.utc),
                 "is_scratchpad_write": function_name in SCRATCHPAD_WRITE_TOOLS,
                 "is_scratchpad_question": function_name in SCRATCHPAD_QUESTION_TOOLS,
             })
@@ -853,7 +876,7 @@ def create_tool_call_middleware(
                             error_type=error_type,
                         ),
                         "call_number": call_number,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": end_time,
                     })
                 else:
                     # Extract full result and ensure it's JSON-serializable
@@ -883,7 +906,7 @@ def create_tool_call_middleware(
                             execution_time_ms=execution_time_ms,
                         ),
                         "call_number": call_number,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": end_time,
                         "is_scratchpad_write": function_name in SCRATCHPAD_WRITE_TOOLS,
                         "section_name": section_name,
                         "tool_type": function_name,  # Include tool type for frontend routing
@@ -1338,45 +1361,49 @@ class AgentOrchestrator:
             raise RuntimeError("MCP Scratchpad not configured")
         
         try:
-            # Find read_plan function
-            read_plan_fn = None
-            for fn in mcp_tool.functions:
-                if fn.name == "read_plan":
-                    read_plan_fn = fn
-                    break
-            
-            if not read_plan_fn:
-                raise RuntimeError("read_plan tool not available")
-            
-            # No session_id parameter - it's in the header
-            result = await read_plan_fn()
-            full_text = self._parse_mcp_result(result)
-            
-            if not full_text:
-                return {"tasks": [], "total_tasks": 0, "tasks_by_status": {}}
-            
-            try:
-                data = json.loads(full_text)
-                tasks = data.get("tasks", [])
-                
-                # Count by status
-                by_status = {"todo": 0, "in-progress": 0, "done": 0, "blocked": 0}
-                for task in tasks:
-                    status = task.get("status", "todo")
-                    if status in by_status:
-                        by_status[status] += 1
-                
-                return {
-                    "tasks": tasks,
-                    "total_tasks": len(tasks),
-                    "tasks_by_status": by_status,
-                }
-            except json.JSONDecodeError:
-                return {"tasks": [], "total_tasks": 0, "tasks_by_status": {}}
+            return await self._read_scratchpad_plan(mcp_tool)
         finally:
             # Close the uncached MCP connection
             await mcp_tool.__aexit__(None, None, None)
 
+    async def _read_scratchpad_plan(self, mcp_tool: MCPStreamableHTTPTool) -> dict[str, Any]:
+        """Read the research plan through a connected session MCP tool."""
+        # Find read_plan function
+        read_plan_fn = None
+        for fn in mcp_tool.functions:
+            if fn.name == "read_plan":
+                read_plan_fn = fn
+                break
+        
+        if not read_plan_fn:
+            raise RuntimeError("read_plan tool not available")
+        
+        # No session_id parameter - it's in the header
+        result = await read_plan_fn()
+        full_text = self._parse_mcp_result(result)
+        
+        if not full_text:
+            return {"tasks": [], "total_tasks": 0, "tasks_by_status": {}}
+        
+        try:
+            data = json.loads(full_text)
+            tasks = data.get("tasks", [])
+            
+            # Count by status
+            by_status = {"todo": 0, "in-progress": 0, "done": 0, "blocked": 0}
+            for task in tasks:
+                status = task.get("status", "todo")
+                if status in by_status:
+                    by_status[status] += 1
+            
+            return {
+                "tasks": tasks,
+                "total_tasks": len(tasks),
+                "tasks_by_status": by_status,
+            }
+        except json.JSONDecodeError:
+            return {"tasks": [], "total_tasks": 0, "tasks_by_status": {}}
+
     async def get_scratchpad_notes(self, session_id: str) -> dict[str, Any]:
         """Get all research notes.
         
@@ -1397,44 +1424,48 @@ class AgentOrchestrator:
             raise RuntimeError("MCP Scratchpad not configured")
         
         try:
-            # Find read_notes function
-            read_notes_fn = None
-            for fn in mcp_tool.functions:
-                if fn.name == "read_notes":
-                    read_notes_fn = fn
-                    break
-            
-            if not read_notes_fn:
-                raise RuntimeError("read_notes tool not available")
-            
-            # No session_id parameter - it's in the header
-            result = await read_notes_fn()
-            full_text = self._parse_mcp_result(result)
-            
-            if not full_text:
-                return {"notes": [], "total_notes": 0, "notes_by_author": {}}
-            
-            try:
-                data = json.loads(full_text)
-                notes = data.get("notes", [])
-                
-                # Count by author
-                by_author: dict[str, int] = {}
-                for note in notes:
-                    author = note.get("author", "unknown")
-                    by_author[author] = by_author.get(author, 0) + 1
-                
-                return {
-                    "notes": notes,
-                    "total_notes": len(notes),
-                    "notes_by_author": by_author,
-                }
-            except json.JSONDecodeError:
-                return {"notes": [], "total_notes": 0, "notes_by_author": {}}
+            return await self._read_scratchpad_notes(mcp_tool)
         finally:
             # Close the uncached MCP connection
             await mcp_tool.__aexit__(None, None, None)
 
+    async def _read_scratchpad_notes(self, mcp_tool: MCPStreamableHTTPTool) -> dict[str, Any]:
+        """Read the research notes through a connected session MCP tool."""
+        # Find read_notes function
+        read_notes_fn = None
+        for fn in mcp_tool.functions:
+            if fn.name == "read_notes":
+                read_notes_fn = fn
+                break
+        
+        if not read_notes_fn:
+            raise RuntimeError("read_notes tool not available")
+        
+        # No session_id parameter - it's in the header
+        result = await read_notes_fn()
+        full_text = self._parse_mcp_result(result)
+        
+        if not full_text:
+            return {"notes": [], "total_notes": 0, "notes_by_author": {}}
+        
+        try:
+            data = json.loads(full_text)
+            notes = data.get("notes", [])
+            
+            # Count by author
+            by_author: dict[str, int] = {}
+            for note in notes:
+                author = note.get("author", "unknown")
+                by_author[author] = by_author.get(author, 0) + 1
+            
+            return {
+                "notes": notes,
+                "total_notes": len(notes),
+                "notes_by_author": by_author,
+            }
+        except json.JSONDecodeError:
+            return {"notes": [], "total_notes": 0, "notes_by_author": {}}
+
     async def get_scratchpad_draft(self, session_id: str) -> dict[str, Any]:
         """Get all draft report sections.
         
@@ -1455,53 +1486,69 @@ class AgentOrchestrator:
             raise RuntimeError("MCP Scratchpad not configured")
         
         try:
-            # Find read_draft function
-            read_draft_fn = None
-            for fn in mcp_tool.functions:
-                if fn.name == "read_draft":
-                    read_draft_fn = fn
-                    break
-            
-            if not read_draft_fn:
-                raise RuntimeError("read_draft tool not available")
-            
-            # No session_id parameter - it's in the header
-            result = await read_draft_fn()
-            full_text = self._parse_mcp_result(result)
-            
-            if not full_text:
-                return {"sections": [], "total_sections": 0}
-            
-            try:
-                data = json.loads(full_text)
-                raw_sections = data.get("sections", {})
-                
-                # Convert to array format
-                sections = []
-                for section_id, section_data in raw_sections.items():
-                    sections.append({
-                        "section_id": section_id,
-                        "title": section_data.get("title", section_id),
-                        "content": section_data.get("content", ""),
-                        "author": section_data.get("author", "unknown"),
-                        "order": section_data.get("order", 0),
-                        "created_at": section_data.get("last_updated"),
-                        "updated_at": section_data.get("last_updated"),
-                    })
-                
-                # Sort by order
-                sections.sort(key=lambda s: s.get("order", 0))
-                
-                return {
-                    "sections": sections,
-                    "total_sections": len(sections),
-                }
-            except json.JSONDecodeError:
-                return {"sections": [], "total_sections": 0}
+            return await self._read_scratchpad_draft(mcp_tool)
         finally:
             # Close the uncached MCP connection
             await mcp_tool.__aexit__(None, None, None)
 
+    async def _read_scratchpad_draft(self, mcp_tool: MCPStreamableHTTPTool) -> dict[str, Any]:
+        """Read the draft report sections through a connected session MCP tool."""
+        # Find read_draft function
+        read_draft_fn = None
+        for fn in mcp_tool.functions:
+            if fn.name == "read_draft":
+                read_draft_fn = fn
+                break
+        
+        if not read_draft_fn:
+            raise RuntimeError("read_draft tool not available")
+        
+        # No session_id parameter - it's in the header
+        result = await read_draft_fn()
+        full_text = self._parse_mcp_result(result)
+        
+        if not full_text:
+            return {"sections": [], "total_sections": 0}
+        
+        try:
+            data = json.loads(full_text)
+            raw_sections = data.get("sections", {})
+            
+            # Convert to array format
+            sections = []
+            for section_id, section_data in raw_sections.items():
+                sections.append({
+                    "section_id": section_id,
+                    "title": section_data.get("title", section_id),
+                    "content": section_data.get("content", ""),
+                    "author": section_data.get("author", "unknown"),
+                    "order": section_data.get("order", 0),
+                    "created_at": section_data.get("last_updated"),
+                    "updated_at": section_data.get("last_updated"),
+                })
+            
+            # Sort by order
+            sections.sort(key=lambda s: s.get("order", 0))
+            
+            return {
+                "sections": sections,
+                "total_sections": len(sections),
+            }
+        except json.JSONDecodeError:
+            return {"sections": [], "total_sections": 0}
+
+    # Scratchpad resource changed by each write tool: its reader, its name and
+    # the SSE event that pushes its new state to the UI after the write
+    SCRATCHPAD_WRITE_RESOURCES: dict[
+        str, tuple[Callable[..., Awaitable[dict[str, Any]]], str, SSEEventType]
+    ] = {
+        "add_task": (_read_scratchpad_plan, "plan", SSEEventType.PLAN_UPDATED),
+        "add_tasks": (_read_scratchpad_plan, "plan", SSEEventType.PLAN_UPDATED),
+        "update_task": (_read_scratchpad_plan, "plan", SSEEventType.PLAN_UPDATED),
+        "add_note": (_read_scratchpad_notes, "notes", SSEEventType.NOTES_UPDATED),
+        "write_draft_section": (_read_scratchpad_draft, "draft", SSEEventType.DRAFT_UPDATED),
+    }
+
     async def get_scratchpad_questions(self, session_id: str) -> dict[str, Any]:
         """Get all questions for a session.
         
@@ -1659,7 +1706,7 @@ class AgentOrchestrator:
         # Emit SSE event to notify UI
         await event_queue.put({
             "type": "awaiting_user_input",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             "session_id": session_id,
             "data": {
                 "reason": reason,
@@ -2454,15 +2501,18 @@ class AgentOrchestrator:
             accumulated_content = ""
             scratchpad_sections_seen: set[str] = set()
             synthesizer_output: str | None = None  # Capture synthesizer's full output
+            # Increases with every pushed plan/notes/draft state, so clients
+            # can ignore a state older than one they already applied
+            scratchpad_version = 0
             
             # Helper to process a single tool event and yield SSE events
             async def process_tool_event(tool_event: dict[str, Any]) -> AsyncGenerator[SSEEvent, None]:
                 """Process a tool event from the queue and yield SSE events."""
-                nonlocal scratchpad_sections_seen, synthesizer_output
+                nonlocal scratchpad_sections_seen, synthesizer_output, scratchpad_version
                 
                 if tool_event["type"] == "tool_started":
                     event_data: ToolCallStartedData = tool_event["event_data"]
-                    event_timestamp = datetime.fromisoformat(tool_event["timestamp"])
+                    event_timestamp = tool_event["timestamp"]
                     yield SSEEvent(
                         event_type=SSEEventType.TOOL_CALL_STARTED,
                         session_id=session_id,
@@ -2478,7 +2528,7 @@ class AgentOrchestrator:
                     self._tool_call_log.append({
                         "tool": event_data.tool_name,
                         "tool_call_id": event_data.tool_call_id,
-                        "started_at": tool_event["timestamp"],
+                        "started_at": event_timestamp.isoformat(),
                         "call_number": tool_event["call_number"],
                         "input_args": event_data.input_args,
                     })
@@ -2486,7 +2536,7 @@ class AgentOrchestrator:
                 elif tool_event["type"] == "tool_completed":
                     event_data_completed: ToolCallCompletedData = tool_event["event_data"]
                     tool_name = event_data_completed.tool_name
-                    event_timestamp = datetime.fromisoformat(tool_event["timestamp"])
+                    event_timestamp = tool_event["timestamp"]
                     yield SSEEvent(
                         event_type=SSEEventType.TOOL_CALL_COMPLETED,
                         session_id=session_id,
@@ -2644,6 +2694,36 @@ class AgentOrchestrator:
                                 task_update=task_update,
                             ).model_dump(),
                         )
+                        
+                        # Push the changed resource's new state so the UI does
+                        # not have to poll the scratchpad after this write. Reads
+                        # go through the session's cached snapshot connection
+                        # instead of opening a new MCP session per write.
+                        if tool_type in self.SCRATCHPAD_WRITE_RESOURCES:
+                            reader, resource, resource_event_type = (
+                                self.SCRATCHPAD_WRITE_RESOURCES[tool_type]
+                            )
+                            try:
+                                snapshot_tool = await self._get_session_mcp_tool(
+                                    session_id, caller_agent="snapshot"
+                                )
+                                if snapshot_tool is None:
+                                    raise RuntimeError("MCP Scratchpad not configured")
+                                resource_data = await reader(self, snapshot_tool)
+                            except Exception as e:
+                                logger.warning(
+                                    f"Could not read scratchpad {resource} after {tool_type}: {e}"
+                                )
+                            else:
+                                scratchpad_version += 1
+                                yield SSEEvent(
+                                    event_type=resource_event_type,
+                                    session_id=session_id,
+                                    data={
+                                        "version": scratchpad_version,
+                                        resource: {"session_id": session_id, **resource_data},
+                                    },
+                                )
                     
                     # If this was add_question, emit QUESTION_ADDED event
                     tool_type = tool_event.get("tool_type")
@@ -2692,7 +2772,7 @@ class AgentOrchestrator:
                 
                 elif tool_event["type"] == "tool_failed":
                     event_data_failed: ToolCallFailedData = tool_event["event_data"]
-                    event_timestamp = datetime.fromisoformat(tool_event["timestamp"])
+                    event_timestamp = tool_event["timestamp"]
                     yield SSEEvent(
                         event_type=SSEEventType.TOOL_CALL_FAILED,
                         session_id=session_id,
@@ -2710,7 +2790,7 @@ class AgentOrchestrator:
                 # === Subagent streaming events (from stream_callback) ===
                 elif tool_event["type"] == "subagent_tool_started":
                     subagent_event: SubagentToolStartedData = tool_event["event_data"]
-                    event_timestamp = datetime.fromisoformat(tool_event["timestamp"])
+                    event_timestamp = tool_event["timestamp"]
                     yield SSEEvent(
                         event_type=SSEEventType.SUBAGENT_TOOL_STARTED,
                         session_id=session_id,
@@ -2725,7 +2805,7 @@ class AgentOrchestrator:
                 
                 elif tool_event["type"] == "subagent_tool_completed":
                     subagent_completed: SubagentToolCompletedData = tool_event["event_data"]
-                    event_timestamp = datetime.fromisoformat(tool_event["timestamp"])
+                    event_timestamp = tool_event["timestamp"]
                     yield SSEEvent(
                         event_type=SSEEventType.SUBAGENT_TOOL_COMPLETED,
                         session_id=session_id,
@@ -2740,7 +2820,7 @@ class AgentOrchestrator:
                 
                 elif tool_event["type"] == "subagent_progress":
                     subagent_progress: SubagentProgressData = tool_event["event_data"]
-                    event_timestamp = datetime.fromisoformat(tool_event["timestamp"])
+                    event_timestamp = tool_event["timestamp"]
                     yield SSEEvent(
                         event_type=SSEEventType.SUBAGENT_PROGRESS,
                         session_id=session_id,
@@ -2753,7 +2833,7 @@ class AgentOrchestrator:
                 
                 # === Human-in-the-loop events ===
                 elif tool_event["type"] == "awaiting_user_input":
-                    event_timestamp = datetime.fromisoformat(tool_event["timestamp"])
+                    event_timestamp = tool_event["timestamp"]
                     yield SSEEvent(
                         event_type=SSEEventType.AWAITING_USER_INPUT,
                         session_id=session_id,
@@ -2764,53 +2844,52 @@ class AgentOrchestrator:
                         },
                     )
 
-            # Stream the orchestrator's execution with concurrent queue processing
-            # Use asyncio to interleave queue events with stream updates
-            stream_iter = orchestrator_agent.run_stream(
+            # Stream the orchestrator's execution with concurrent queue processing.
+            # One pump task drains the agent stream into the same queue the tool
+            # middleware feeds, so a single blocking get() interleaves stream
+            # updates with tool events - no per-update task and no timed polling.
+            stream = orchestrator_agent.run_stream(
                 f"Please conduct comprehensive research on: {session.query}",
                 thread=orchestrator_thread,
                 middleware=[tool_middleware],
-            ).__aiter__()
+            )
             
-            stream_exhausted = False
-            pending_stream_task: asyncio.Task | None = None
+            async def pump_stream() -> None:
+                try:
+                    async for update in stream:
+                        await event_queue.put({"type": "stream_update", "update": update})
+                except Exception as e:
+                    await event_queue.put({"type": "stream_failed", "error": e})
+                else:
+                    await event_queue.put({"type": "stream_done"})
             
-            while not stream_exhausted:
-                # Create task for next stream update if not already pending
-                if pending_stream_task is None:
-                    pending_stream_task = asyncio.create_task(stream_iter.__anext__())
-                
-                # Wait for either: stream update OR queue event (with short timeout)
-                # This allows us to emit queue events even while waiting for stream
-                queue_event = await event_queue.get(timeout=0.1)
-                
-                if queue_event is not None:
-                    # Process queue event immediately
-                    async for sse_event in process_tool_event(queue_event):
-                        yield sse_event
-                    continue  # Check for more queue events before waiting on stream
-                
-                # No queue events - check if stream task is done
-                if pending_stream_task.done():
-                    try:
-                        update = pending_stream_task.result()
-                        pending_stream_task = None
-                        
-                        # Drain any remaining queue events
-                        while True:
-                            tool_event = event_queue.get_nowait()
-                            if tool_event is None:
-                                break
-                            async for sse_event in process_tool_event(tool_event):
-                                yield sse_event
-                        
+            stream_task = asyncio.create_task(pump_stream())
+            
+            try:
+                while True:
+                    queue_event = await event_queue.get()
+                    queue_event_type = queue_event["type"]
+                    
+                    if queue_event_type == "stream_update":
                         # Accumulate text output
+                        update = queue_event["update"]
                         if update.text:
                             accumulated_content += update.text
-                            
-                    except StopAsyncIteration:
-                        stream_exhausted = True
-                        pending_stream_task = None
+                    elif queue_event_type == "stream_done":
+                        break
+                    elif queue_event_type == "stream_failed":
+                        raise queue_event["error"]
+                    else:
+                        async for sse_event in process_tool_event(queue_event):
+                            yield sse_event
+            finally:
+                # Stop the pump if the workflow is abandoned mid-stream
+                if not stream_task.done():
+                    stream_task.cancel()
+                    try:
+                        await stream_task
+                    except asyncio.CancelledError:
+                        pass
 
             # Drain any remaining events from the queue
             event_queue.close()
@@ -29,6 +29,7 @@ Usage:
 import asyncio
 import logging
 import random
+import re
 from collections.abc import AsyncIterable, Awaitable, Callable
 from typing import Any
 
@@ -78,7 +79,6 @@ def _extract_retry_after(exception: Exception) -> float | None:
     error_str = str(exception)
     
     # Try to extract "retry after X seconds" pattern
-    import re
     patterns = [
         r"retry[- ]?after[:\s]*(\d+(?:\.\d+)?)",
         r"try again in (\d+(?:\.\d+)?)\s*second",
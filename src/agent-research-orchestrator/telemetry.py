@@ -19,6 +19,25 @@ logger = logging.getLogger(__name__)
 # Flag to track if telemetry has been configured
 _telemetry_configured = False
 
+# Fraction of traces exported when APPLICATIONINSIGHTS_SAMPLING_RATIO is unset.
+# Sampling is decided per trace ID, so a sampled research session keeps all
+# of its spans.
+DEFAULT_SAMPLING_RATIO = 1.0
+
+
+def _get_sampling_ratio() -> float:
+    """Read the trace sampling ratio from the environment, clamped to [0, 1]."""
+    raw = os.getenv("APPLICATIONINSIGHTS_SAMPLING_RATIO")
+    if not raw:
+        return DEFAULT_SAMPLING_RATIO
+    try:
+        return min(max(float(raw), 0.0), 1.0)
+    except ValueError:
+        logger.warning(
+            "Invalid APPLICATIONINSIGHTS_SAMPLING_RATIO %r, using %s", raw, DEFAULT_SAMPLING_RATIO
+        )
+        return DEFAULT_SAMPLING_RATIO
+
 
 def configure_telemetry(service_name: str = "agent-research-orchestrator") -> None:
     """Configure OpenTelemetry with Azure Monitor export.
@@ -57,10 +76,12 @@ def configure_telemetry(service_name: str = "agent-research-orchestrator") -> No
         from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 
         # Configure Azure Monitor as the exporter
+        sampling_ratio = _get_sampling_ratio()
         configure_azure_monitor(
             connection_string=connection_string,
             service_name=service_name,
             enable_live_metrics=True,
+            sampling_ratio=sampling_ratio,
         )
 
         # Auto-instrument FastAPI (requests/responses)
@@ -77,7 +98,10 @@ def configure_telemetry(service_name: str = "agent-research-orchestrator") -> No
         except ImportError:
             logger.debug("AIAgentsInstrumentor not available, skipping agent instrumentation")
 
-        logger.info(f"Telemetry configured for {service_name} with Azure Monitor")
+        logger.info(
+            f"Telemetry configured for {service_name} with Azure Monitor "
+            f"(sampling ratio {sampling_ratio})"
+        )
         _telemetry_configured = True
 
     except ImportError as e:
@@ -23,7 +23,9 @@ Latency Expectation:
 """
 
 import asyncio
+import json
 import logging
+import traceback
 from datetime import datetime, timedelta, timezone
 from typing import Any, AsyncGenerator
 
@@ -157,6 +159,8 @@ class AppInsightsTracePoller:
         self._last_poll_time: datetime | None = None
         self._seen_span_ids: set[str] = set()  # Deduplicate spans
         self._is_running = False
+        # Set by stop() and __aexit__ to cut the wait between polls short
+        self._stop_requested = asyncio.Event()
         self._poll_count = 0
         self._total_traces_found = 0
         
@@ -174,6 +178,7 @@ class AppInsightsTracePoller:
         
         self._client = LogsQueryClient(self._credential)
         self._is_running = True
+        self._stop_requested.clear()
         
         logger.info(f"TracePoller started for session {self.session_id[:8]}...")
         return self
@@ -181,6 +186,7 @@ class AppInsightsTracePoller:
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Cleanup resources."""
         self._is_running = False
+        self._stop_requested.set()
         
         if self._client:
             await self._client.close()
@@ -262,7 +268,6 @@ class AppInsightsTracePoller:
             # Parse custom dimensions (may be JSON string or dict)
             custom_dims = data.get("customDimensions", {})
             if isinstance(custom_dims, str):
-                import json
                 try:
                     custom_dims = json.loads(custom_dims)
                 except json.JSONDecodeError:
@@ -482,7 +487,6 @@ class AppInsightsTracePoller:
             logger.error(f"TracePoller HTTP error details: {e}")
         except Exception as e:
             logger.exception(f"TracePoller unexpected error: {e}")
-            import traceback
             logger.error(f"TracePoller full traceback: {traceback.format_exc()}")
         
         # Update last poll time
@@ -508,7 +512,7 @@ class AppInsightsTracePoller:
                     yield event
                 
                 # Wait before next poll
-                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+                await self._wait_for_next_poll()
             
             except asyncio.CancelledError:
                 logger.info(f"TracePoller cancelled for session {self.session_id[:8]}...")
@@ -516,7 +520,7 @@ class AppInsightsTracePoller:
             except Exception as e:
                 logger.exception(f"TracePoller error during polling: {e}")
                 # Continue polling after error
-                await asyncio.sleep(POLL_INTERVAL_SECONDS)
+                await self._wait_for_next_poll()
         
         logger.info(f"TracePoller stopped for session {self.session_id[:8]}...")
     
@@ -524,6 +528,19 @@ class AppInsightsTracePoller:
         """Signal the poller to stop."""
         logger.info(f"TracePoller stop requested for session {self.session_id[:8]}...")
         self._is_running = False
+        self._stop_requested.set()
+    
+    async def _wait_for_next_poll(self) -> None:
+        """Wait POLL_INTERVAL_SECONDS, returning as soon as a stop is requested.
+        
+        A stopped poller ends its stream right away instead of finishing a
+        full interval sleep first.
+        """
+        try:
+            async with asyncio.timeout(POLL_INTERVAL_SECONDS):
+                await self._stop_requested.wait()
+        except TimeoutError:
+            pass
 
 
 # Convenience function for creating a poller from config
@@ -91,6 +91,12 @@ export async function getSession(sessionId: string): Promise<ResearchSession> {
   return mapSessionFromApi(data);
 }
 
+/**
+ * Consecutive reconnects attempted after a dropped SSE connection before
+ * giving up and reporting an error.
+ */
+const SSE_MAX_RECONNECT_ATTEMPTS = 5;
+
 /**
  * Start a research session and return an EventSource for SSE streaming.
  *
@@ -109,9 +115,13 @@ export function startSession(
   const url = `${API_URL}/research/sessions/${sessionId}/start`;
   const eventSource = new EventSource(url);
   
-  // Track if we've received a terminal event (workflow_completed or workflow_failed)
+  // Track if we've received a terminal event (workflow_completed, workflow_failed or error)
   let workflowEnded = false;
 
+  // Connection errors since the last received event. EventSource reconnects
+  // on its own and sends Last-Event-ID, so the server resumes the stream.
+  let reconnectAttempts = 0;
+
   // SSE event types - both trace-based (primary) and legacy (backward compat)
   const eventTypes = [
     // Trace-based events (primary - handled by frontend)
@@ -122,6 +132,7 @@ export function startSession(
     'trace_span_completed',
     'trace_tool_call',
     'heartbeat',
+    'resync',
     'error',
     // Subagent events (from stream_callback - may not fire for hosted agents)
     'subagent_tool_started',
@@ -136,6 +147,9 @@ export function startSession(
     'tool_call_started',
     'tool_call_completed',
     'scratchpad_updated',
+    'plan_updated',
+    'notes_updated',
+    'draft_updated',
     'synthesis_completed',
     // Question events (human-in-the-loop)
     'question_added',
@@ -155,6 +169,8 @@ export function startSession(
         }
       }
       
+      reconnectAttempts = 0;
+
       try {
         const data = JSON.parse(e.data);
         
@@ -167,8 +183,13 @@ export function startSession(
           console.debug(`[SSE] ${eventType}`);
         }
         
-        // Check for terminal events
-        if (eventType === 'workflow_completed' || eventType === 'workflow_failed') {
+        // Check for terminal events. The server closes the stream right after
+        // an 'error' frame, so reconnecting would only replay nothing
+        if (
+          eventType === 'workflow_completed' ||
+          eventType === 'workflow_failed' ||
+          eventType === 'error'
+        ) {
           workflowEnded = true;
         }
         
@@ -203,6 +224,10 @@ export function startSession(
       // Server closed connection - could be normal end or error
       // Don't report as error, just complete
       onComplete();
+    } else if (reconnectAttempts < SSE_MAX_RECONNECT_ATTEMPTS) {
+      // Connection dropped - let EventSource reconnect and resume
+      reconnectAttempts += 1;
+      console.warn(`[SSE] Connection lost, reconnecting (attempt ${reconnectAttempts})`);
     } else {
       // Actual connection error (network issue, etc.)
       onError(new Error('SSE connection error'));
@@ -376,6 +401,9 @@ export interface DraftData {
 /**
  * Get the current research plan with all tasks.
  *
+ * @deprecated Updates arrive as `plan_updated` SSE events; use
+ * {@link pollScratchpad} for a full refresh.
+ *
  * @param sessionId - The session ID
  * @returns The plan data with tasks
  */
@@ -399,6 +427,9 @@ export async function getPlan(sessionId: string): Promise<PlanData> {
 /**
  * Get all research notes.
  *
+ * @deprecated Updates arrive as `notes_updated` SSE events; use
+ * {@link pollScratchpad} for a full refresh.
+ *
  * @param sessionId - The session ID
  * @returns The notes data
  */
@@ -422,6 +453,9 @@ export async function getNotes(sessionId: string): Promise<NotesData> {
 /**
  * Get current draft sections.
  *
+ * @deprecated Updates arrive as `draft_updated` SSE events; use
+ * {@link pollScratchpad} for a full refresh.
+ *
  * @param sessionId - The session ID
  * @returns The draft data
  */
@@ -445,6 +479,9 @@ export async function getDraft(sessionId: string): Promise<DraftData> {
 /**
  * Poll all scratchpad data at once.
  *
+ * Uses the combined scratchpad endpoint, so plan, notes, and draft arrive in
+ * a single request. A part that failed to load on the server is null.
+ *
  * Note: Questions are intentionally not polled here to avoid race conditions
  * with optimistic updates. Questions are updated via SSE events.
  *
@@ -456,17 +493,24 @@ export async function pollScratchpad(sessionId: string): Promise<{
   notes: NotesData | null;
   draft: DraftData | null;
 }> {
-  const [planResult, notesResult, draftResult] = await Promise.allSettled([
-    getPlan(sessionId),
-    getNotes(sessionId),
-    getDraft(sessionId),
-  ]);
+  try {
+    const response = await fetch(
+      `${API_URL}/research/sessions/${sessionId}/scratchpad`
+    );
 
-  return {
-    plan: planResult.status === 'fulfilled' ? planResult.value : null,
-    notes: notesResult.status === 'fulfilled' ? notesResult.value : null,
-    draft: draftResult.status === 'fulfilled' ? draftResult.value : null,
-  };
+    if (!response.ok) {
+      return { plan: null, notes: null, draft: null };
+    }
+
+    const data = await response.json();
+    return {
+      plan: data.plan ?? null,
+      notes: data.notes ?? null,
+      draft: data.draft ?? null,
+    };
+  } catch {
+    return { plan: null, notes: null, draft: null };
+  }
 }
 
 /**
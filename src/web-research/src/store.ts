@@ -29,6 +29,7 @@ import type {
   DemoStateSnapshot,
 } from './types';
 import { createSession, startSession, pollScratchpad } from './api';
+import type { PlanData, NotesData, DraftData } from './api';
 
 interface ResearchStore {
   // === Session State ===
@@ -38,6 +39,13 @@ interface ResearchStore {
 
   // === Scratchpad State ===
   scratchpad: ScratchpadState;
+  // Version of the last plan/notes/draft state pushed over SSE
+  scratchpadVersion: number;
+  applyScratchpadData: (data: {
+    plan?: PlanData | null;
+    notes?: NotesData | null;
+    draft?: DraftData | null;
+  }) => void;
 
   // Plan actions
   setTasks: (tasks: Task[]) => void;
@@ -104,6 +112,7 @@ export const useResearchStore = create<ResearchStore>((set, get) => ({
 
   // === Scratchpad State ===
   scratchpad: initialScratchpad,
+  scratchpadVersion: 0,
 
   setTasks: (tasks) =>
     set((state) => ({
@@ -275,6 +284,7 @@ export const useResearchStore = create<ResearchStore>((set, get) => ({
 
     set({
       scratchpad: initialScratchpad,
+      scratchpadVersion: 0,
       activities: [],
       isConnected: false,
     });
@@ -444,6 +454,12 @@ export const useResearchStore = create<ResearchStore>((set, get) => ({
         console.debug('SSE heartbeat received');
         break;
 
+      // Reconnected after events the server no longer buffers - refetch state
+      case 'resync':
+        console.warn('[SSE] Missed events could not be replayed, refetching state');
+        store.pollScratchpadState().catch(() => {});
+        break;
+
       // === Error ===
       case 'error':
         store.addActivity({
@@ -570,10 +586,8 @@ export const useResearchStore = create<ResearchStore>((set, get) => ({
           preview: outputPreview,
           agentColor: getAgentColor(toolData.agent_name),
         });
-        // Poll scratchpad after tool calls
-        if (isScratchpadTool(toolData.tool_name || '')) {
-          store.pollScratchpadState().catch(() => {});
-        }
+        // Scratchpad writes are followed by a pushed plan/notes/draft_updated
+        // event, so no poll is needed here
         break;
       }
 
@@ -602,7 +616,24 @@ export const useResearchStore = create<ResearchStore>((set, get) => ({
           preview: scratchData.content_preview,  // Store full text, truncation handled in UI
           agentColor: getAgentColor(scratchData.updated_by),
         });
-        store.pollScratchpadState().catch(() => {});
+        break;
+      }
+
+      // Full resource state pushed after a scratchpad write. Skip anything older
+      // than the last state applied.
+      case 'plan_updated':
+      case 'notes_updated':
+      case 'draft_updated': {
+        const version = (data.version as number | undefined) ?? 0;
+        if (version <= store.scratchpadVersion) {
+          break;
+        }
+        set({ scratchpadVersion: version });
+        store.applyScratchpadData({
+          plan: data.plan as PlanData | undefined,
+          notes: data.notes as NotesData | undefined,
+          draft: data.draft as DraftData | undefined,
+        });
         break;
       }
 
@@ -768,6 +799,49 @@ export const useResearchStore = create<ResearchStore>((set, get) => ({
     }
   },
 
+  applyScratchpadData: ({ plan, notes, draft }) => {
+    if (plan && plan.tasks.length > 0) {
+      const tasks: Task[] = plan.tasks.map((t, idx) => ({
+        id: t.task_id || `task-${idx}-${Date.now()}`,
+        description: t.description,
+        status: t.status as TaskStatus,
+        assignedTo: t.assigned_to,
+        createdAt: t.created_at || new Date().toISOString(),
+      }));
+      set((state) => ({
+        scratchpad: { ...state.scratchpad, plan: tasks },
+      }));
+    }
+
+    if (notes && notes.notes.length > 0) {
+      const notesList: Note[] = notes.notes.map((n) => ({
+        id: n.note_id || n.id || `note-${Date.now()}`,
+        content: n.content,
+        author: n.author,
+        timestamp: n.created_at || n.timestamp || new Date().toISOString(),
+        tags: [],
+        sourceUrl: n.source_url,
+      }));
+      set((state) => ({
+        scratchpad: { ...state.scratchpad, notes: notesList },
+      }));
+    }
+
+    if (draft && draft.sections.length > 0) {
+      const draftSections: DraftSection[] = draft.sections.map((s) => ({
+        id: s.section_id,
+        title: s.title,
+        content: s.content,
+        lastUpdatedBy: s.author,
+        lastUpdatedAt: s.updated_at || s.created_at,
+        version: 1,
+      }));
+      set((state) => ({
+        scratchpad: { ...state.scratchpad, draft: draftSections },
+      }));
+    }
+  },
+
   pollScratchpadState: async () => {
     const store = get();
     const session = store.session;
@@ -781,47 +855,7 @@ export const useResearchStore = create<ResearchStore>((set, get) => ({
       // with optimistic updates when users are answering questions.
       // Questions are updated via SSE events (question_added) and optimistic local updates.
       const { plan, notes, draft } = await pollScratchpad(session.sessionId);
-
-      if (plan && plan.tasks.length > 0) {
-        const tasks: Task[] = plan.tasks.map((t, idx) => ({
-          id: t.task_id || `task-${idx}-${Date.now()}`,
-          description: t.description,
-          status: t.status as TaskStatus,
-          assignedTo: t.assigned_to,
-          createdAt: t.created_at || new Date().toISOString(),
-        }));
-        set((state) => ({
-          scratchpad: { ...state.scratchpad, plan: tasks },
-        }));
-      }
-
-      if (notes && notes.notes.length > 0) {
-        const notesList: Note[] = notes.notes.map((n) => ({
-          id: n.note_id || n.id || `note-${Date.now()}`,
-          content: n.content,
-          author: n.author,
-          timestamp: n.created_at || n.timestamp || new Date().toISOString(),
-          tags: [],
-          sourceUrl: n.source_url,
-        }));
-        set((state) => ({
-          scratchpad: { ...state.scratchpad, notes: notesList },
-        }));
-      }
-
-      if (draft && draft.sections.length > 0) {
-        const draftSections: DraftSection[] = draft.sections.map((s) => ({
-          id: s.section_id,
-          title: s.title,
-          content: s.content,
-          lastUpdatedBy: s.author,
-          lastUpdatedAt: s.updated_at || s.created_at,
-          version: 1,
-        }));
-        set((state) => ({
-          scratchpad: { ...state.scratchpad, draft: draftSections },
-        }));
-      }
+      store.applyScratchpadData({ plan, notes, draft });
     } catch (error) {
       console.debug('Scratchpad poll error:', error);
     }
@@ -836,6 +870,7 @@ export const useResearchStore = create<ResearchStore>((set, get) => ({
     set({
       session: null,
       scratchpad: initialScratchpad,
+      scratchpadVersion: 0,
       activities: [],
       finalReport: null,
       isDemoMode: false,
@@ -151,6 +151,9 @@ export type SSEEventType =
   | 'subagent_progress'
   // Scratchpad events (primary - from middleware)
   | 'scratchpad_updated'
+  | 'plan_updated'        // Full plan state after a write
+  | 'notes_updated'       // Full notes state after a write
+  | 'draft_updated'       // Full draft state after a write
   // Question events (human-in-the-loop)
   | 'question_added'
   | 'awaiting_user_input'
@@ -159,6 +162,7 @@ export type SSEEventType =
   | 'synthesis_completed'
   // Keep-alive
   | 'heartbeat'
+  | 'resync'
   // Error fallback
   | 'error'
   // Trace events (observability only - not actively used for UI)